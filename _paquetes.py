@@ -0,0 +1,49 @@
+"""
+Utilidades comunes de los paquetes de patrones (creational, structural y behavioural)
+
+Cada paquete declara en su __init__ qué nombres públicos exporta y en qué módulo están; atributos_perezosos() genera el
+__getattr__ y el __dir__ que los cargan bajo demanda. ejecutar_ejemplos() es el punto de entrada de python -m <paquete>.
+"""
+
+import importlib
+import sys
+
+
+def atributos_perezosos(espacio: dict, atributos: dict) -> tuple:
+    # espacio son los globals() del paquete: ahí se guarda cada valor cargado
+    paquete = espacio["__name__"]
+
+    def __getattr__(nombre: str):
+        modulo = atributos.get(nombre)
+        if modulo is None:
+            raise AttributeError(f"module {paquete!r} has no attribute {nombre!r}")
+        valor = getattr(importlib.import_module(f".{modulo}", paquete), nombre)
+        # Se guarda en el paquete para que los siguientes accesos no pasen por __getattr__
+        espacio[nombre] = valor
+        return valor
+
+    def __dir__():
+        return sorted(set(espacio) | set(atributos))
+
+    return __getattr__, __dir__
+
+
+def ejecutar_ejemplos(paquete: str, ruta_paquete: list, patrones: list) -> int:
+    # pkgutil solo hace falta al ejecutar los ejemplos, no al importar los paquetes
+    import pkgutil
+
+    modulos = [modulo.name for modulo in pkgutil.iter_modules(ruta_paquete) if not modulo.name.startswith("_")]
+    if patrones:
+        # Cada patrón se puede indicar con o sin el prefijo del paquete ("prototype" o "creational_prototype")
+        por_nombre = {modulo.removeprefix(f"{paquete}_"): modulo for modulo in modulos}
+        por_nombre.update({modulo: modulo for modulo in modulos})
+        desconocidos = [patron for patron in patrones if patron not in por_nombre]
+        if desconocidos:
+            print(f"Patrones desconocidos: {', '.join(desconocidos)}", file=sys.stderr)
+            return 1
+        modulos = [por_nombre[patron] for patron in patrones]
+
+    for modulo in modulos:
+        print(f"=== {modulo}")
+        importlib.import_module(f"{paquete}.{modulo}").demo()
+    return 0
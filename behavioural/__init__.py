@@ -0,0 +1,62 @@
+"""
+Patrones de diseño de comportamiento
+
+Importar el paquete no ejecuta ningún ejemplo ni importa sus módulos: cada clase se carga la primera vez que se accede 
+a ella (por ejemplo, behavioural.ManejadorDescuento). Los ejemplos se ejecutan con: python -m behavioural [patron ...]
+"""
+
+from _paquetes import atributos_perezosos
+
+# Nombre público -> módulo del paquete que lo define
+_ATRIBUTOS = {
+    # behavioural_chain_of_responsibility
+    "ManejadorDescuento": "behavioural_chain_of_responsibility",
+    "ManejadorDescuento10": "behavioural_chain_of_responsibility",
+    "ManejadorDescuento20": "behavioural_chain_of_responsibility",
+    "ManejadorDescuento30": "behavioural_chain_of_responsibility",
+    "aplicar_descuento_chain": "behavioural_chain_of_responsibility",
+
+    # behavioural_command
+    "ComandoCalculadora": "behavioural_command",
+    "ComandoSumar": "behavioural_command",
+    "ComandoRestar": "behavioural_command",
+    "ComandoMultiplicar": "behavioural_command",
+    "ComandoDividir": "behavioural_command",
+    "Calculadora": "behavioural_command",
+    "InvocadorCalculadora": "behavioural_command",
+
+    # behavioural_interpreter
+    "Expresion": "behavioural_interpreter",
+    "Numero": "behavioural_interpreter",
+    "Suma": "behavioural_interpreter",
+    "Resta": "behavioural_interpreter",
+
+    # behavioural_observer
+    "FuenteNoticias": "behavioural_observer",
+    "NotificadorNoticias": "behavioural_observer",
+    "FuenteNoticiasABC": "behavioural_observer",
+    "FuenteNoticiasBBC": "behavioural_observer",
+
+    # behavioural_state
+    "EstadoReproductorMusica": "behavioural_state",
+    "EstadoReproduciendo": "behavioural_state",
+    "EstadoPausa": "behavioural_state",
+    "EstadoDetenido": "behavioural_state",
+    "ReproductorMusica": "behavioural_state",
+
+    # behavioural_strategy
+    "EstrategiaOrdenamiento": "behavioural_strategy",
+    "EstrategiaOrdenAscendente": "behavioural_strategy",
+    "EstrategiaOrdenDescendente": "behavioural_strategy",
+    "Ordenamiento": "behavioural_strategy",
+
+    # behavioural_template_method
+    "Receta": "behavioural_template_method",
+    "RecetaPastel": "behavioural_template_method",
+    "RecetaSopa": "behavioural_template_method",
+}
+
+__all__ = list(_ATRIBUTOS)
+
+
+__getattr__, __dir__ = atributos_perezosos(globals(), _ATRIBUTOS)
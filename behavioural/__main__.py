@@ -0,0 +1,21 @@
+"""
+Ejecuta los ejemplos de los patrones de comportamiento.
+
+Uso: python -m behavioural [patron ...]
+
+Sin argumentos se ejecutan todos los ejemplos; si se indican patrones (por ejemplo, "observer"), solo esos.
+"""
+
+import sys
+
+from _paquetes import ejecutar_ejemplos
+
+from . import __path__ as _ruta_paquete
+
+
+def main(patrones: list) -> int:
+    return ejecutar_ejemplos(__package__, _ruta_paquete, patrones)
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -69,23 +69,24 @@ def aplicar_descuento_chain(manejador: ManejadorDescuento, monto_compra: float):
     else:
         print(f"Total con descuento: {monto_compra - descuento}")
 
-# Creación de la cadena de manejadores
-manejador_30 = ManejadorDescuento30()
-manejador_20 = ManejadorDescuento20(manejador_30)
-manejador_10 = ManejadorDescuento10(manejador_20)
+def demo():
+    # Creación de la cadena de manejadores
+    manejador_30 = ManejadorDescuento30()
+    manejador_20 = ManejadorDescuento20(manejador_30)
+    manejador_10 = ManejadorDescuento10(manejador_20)
 
-# Prueba con diferentes montos de compra
-aplicar_descuento_chain(manejador_10, 250)
-# Output: Descuento del 20% aplicado
-# Total con descuento: 200.0
+    # Prueba con diferentes montos de compra
+    aplicar_descuento_chain(manejador_10, 250)
+    # Output: Descuento del 20% aplicado
+    # Total con descuento: 200.0
 
-aplicar_descuento_chain(manejador_10, 120)
-# Output: Descuento del 10% aplicado
-# Total con descuento: 108.0
+    aplicar_descuento_chain(manejador_10, 120)
+    # Output: Descuento del 10% aplicado
+    # Total con descuento: 108.0
 
-aplicar_descuento_chain(manejador_10, 400)
-# Output: Descuento del 30% aplicado
-# Total con descuento: 280.0
+    aplicar_descuento_chain(manejador_10, 400)
+    # Output: Descuento del 30% aplicado
+    # Total con descuento: 280.0
 
 """
 En este ejemplo, tenemos la clase ManejadorDescuento, que es la clase base para los manejadores concretos. Cada 
@@ -99,4 +100,8 @@ En resumen, el patrón Chain of Responsibility es útil cuando tienes una serie
 solicitud en un orden específico, pero no sabes cuál de ellos puede manejar la solicitud en tiempo de diseño. Con este 
 patrón, puedes encadenar los objetos y pasar la solicitud a lo largo de la cadena hasta que uno de ellos la maneje. Esto 
 promueve la desacoplaración y la flexibilidad en el procesamiento de las solicitudes.
-"""
\ No newline at end of file
+"""
+
+
+if __name__ == "__main__":
+    demo()
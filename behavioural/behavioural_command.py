@@ -88,18 +88,19 @@ class InvocadorCalculadora:
         for operacion in self.operaciones:
             operacion.ejecutar()
 
-# Ejemplo de uso del patrón Command
-calculadora = Calculadora()
-invocador = InvocadorCalculadora()
+def demo():
+    # Ejemplo de uso del patrón Command
+    calculadora = Calculadora()
+    invocador = InvocadorCalculadora()
 
-invocador.agregar_operacion(ComandoSumar(calculadora, 5))
-invocador.agregar_operacion(ComandoRestar(calculadora, 2))
-invocador.agregar_operacion(ComandoMultiplicar(calculadora, 3))
-invocador.agregar_operacion(ComandoDividir(calculadora, 2))
+    invocador.agregar_operacion(ComandoSumar(calculadora, 5))
+    invocador.agregar_operacion(ComandoRestar(calculadora, 2))
+    invocador.agregar_operacion(ComandoMultiplicar(calculadora, 3))
+    invocador.agregar_operacion(ComandoDividir(calculadora, 2))
 
-invocador.ejecutar_operaciones()
+    invocador.ejecutar_operaciones()
 
-print(calculadora.valor)  # Output: 8.0
+    print(calculadora.valor)  # Output: 8.0
 
 """
 En este ejemplo, tenemos la clase ComandoCalculadora, que es la interfaz base para los comandos concretos (ComandoSumar, 
@@ -119,4 +120,8 @@ En resumen, el patrón Command es útil cuando necesitas desacoplar el emisor de
 la lleva a cabo. Encapsula la solicitud como un objeto, lo que permite que la solicitud sea parametrizable y pueda ser 
 encolada, deshecha, registrada o reutilizada. Esto promueve la flexibilidad y el mantenimiento del código, ya que puedes 
 cambiar y agregar nuevas acciones sin afectar al cliente.
-"""
\ No newline at end of file
+"""
+
+
+if __name__ == "__main__":
+    demo()
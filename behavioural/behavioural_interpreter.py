@@ -45,10 +45,11 @@ class Resta(Expresion):
     def evaluar(self):
         return self.izquierda.evaluar() - self.derecha.evaluar()
 
-# Ejemplo de uso del patrón Interpreter
-expresion = Resta(Suma(Numero(10), Numero(5)), Numero(2))
-resultado = expresion.evaluar()
-print(resultado)  # Output: 13
+def demo():
+    # Ejemplo de uso del patrón Interpreter
+    expresion = Resta(Suma(Numero(10), Numero(5)), Numero(2))
+    resultado = expresion.evaluar()
+    print(resultado)  # Output: 13
 
 """
 En este ejemplo, tenemos la clase Expresion, que es la interfaz base para las expresiones concretas. Cada clase concreta 
@@ -67,4 +68,8 @@ En resumen, el patrón Interpreter es útil cuando necesitas definir una gramát
 escritas en ese lenguaje. Con este patrón, puedes representar la gramática en forma de objetos y proporcionar un 
 intérprete que evalúe las expresiones siguiendo las reglas de la gramática. Esto promueve la extensibilidad y el 
 mantenimiento del código, ya que puedes agregar nuevas expresiones o reglas sin afectar el intérprete existente.
-"""
\ No newline at end of file
+"""
+
+
+if __name__ == "__main__":
+    demo()
@@ -49,20 +49,21 @@ class FuenteNoticiasBBC(FuenteNoticias):
     def actualizar(self, noticia):
         print(f"Noticia recibida en BBC: {noticia}")
 
-# Ejemplo de uso del patrón Observer
-notificador = NotificadorNoticias()
+def demo():
+    # Ejemplo de uso del patrón Observer
+    notificador = NotificadorNoticias()
 
-fuente_abc = FuenteNoticiasABC()
-fuente_bbc = FuenteNoticiasBBC()
+    fuente_abc = FuenteNoticiasABC()
+    fuente_bbc = FuenteNoticiasBBC()
 
-notificador.agregar_observador(fuente_abc)
-notificador.agregar_observador(fuente_bbc)
+    notificador.agregar_observador(fuente_abc)
+    notificador.agregar_observador(fuente_bbc)
 
-notificador.publicar_noticia("¡Nuevo avance científico!")
-# Output:
-# Noticia publicada: ¡Nuevo avance científico!
-# Noticia recibida en ABC: ¡Nuevo avance científico!
-# Noticia recibida en BBC: ¡Nuevo avance científico!
+    notificador.publicar_noticia("¡Nuevo avance científico!")
+    # Output:
+    # Noticia publicada: ¡Nuevo avance científico!
+    # Noticia recibida en ABC: ¡Nuevo avance científico!
+    # Noticia recibida en BBC: ¡Nuevo avance científico!
 
 """
 En este ejemplo, tenemos la clase FuenteNoticias que actúa como el observador y define un método actualizar() que será 
@@ -82,4 +83,8 @@ En resumen, el patrón Observer es útil cuando necesitas establecer una relaci
 que los observadores sean notificados automáticamente sobre los cambios del sujeto sin acoplarse directamente a él. Esto 
 facilita la extensibilidad y la reutilización del código, ya que puedes agregar nuevos observadores sin modificar el 
 código del sujeto.
-"""
\ No newline at end of file
+"""
+
+
+if __name__ == "__main__":
+    demo()
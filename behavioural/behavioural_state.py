@@ -81,16 +81,17 @@ class ReproductorMusica:
     def detener(self):
         self.estado_actual.detener()
 
-# Ejemplo de uso del patrón State
-reproductor = ReproductorMusica()
+def demo():
+    # Ejemplo de uso del patrón State
+    reproductor = ReproductorMusica()
 
-reproductor.reproducir()  # Output: Iniciando la reproducción.
-reproductor.pausar()  # Output: El reproductor está detenido y no se puede pausar.
+    reproductor.reproducir()  # Output: Iniciando la reproducción.
+    reproductor.pausar()  # Output: El reproductor está detenido y no se puede pausar.
 
-reproductor.cambiar_estado(EstadoReproduciendo())
-reproductor.reproducir()  # Output: El reproductor ya está reproduciendo música.
-reproductor.pausar()  # Output: Pausando la reproducción.
-reproductor.detener()  # Output: Deteniendo la reproducción.
+    reproductor.cambiar_estado(EstadoReproduciendo())
+    reproductor.reproducir()  # Output: El reproductor ya está reproduciendo música.
+    reproductor.pausar()  # Output: Pausando la reproducción.
+    reproductor.detener()  # Output: Deteniendo la reproducción.
 
 
 """
@@ -110,4 +111,8 @@ En resumen, el patrón State es útil cuando tienes un objeto que puede cambiar
 Con este patrón, puedes representar diferentes estados como clases separadas y permitir que el objeto cambie de un 
 estado a otro conforme cambie su estado interno. Esto promueve la flexibilidad y el mantenimiento del código, ya que 
 puedes agregar nuevos estados y comportamientos sin afectar el contexto que los utiliza.
-"""
\ No newline at end of file
+"""
+
+
+if __name__ == "__main__":
+    demo()
@@ -43,20 +43,21 @@ class Ordenamiento:
     def ordenar_lista(self, lista):
         return self.estrategia.ordenar(lista)
 
-# Ejemplo de uso del patrón Strategy
-lista_numeros = [5, 2, 8, 1, 9]
-
-# Ordenamiento ascendente
-estrategia_ascendente = EstrategiaOrdenAscendente()
-ordenamiento = Ordenamiento(estrategia_ascendente)
-resultado_ascendente = ordenamiento.ordenar_lista(lista_numeros)
-print(resultado_ascendente)  # Output: [1, 2, 5, 8, 9]
-
-# Ordenamiento descendente
-estrategia_descendente = EstrategiaOrdenDescendente()
-ordenamiento.establecer_estrategia(estrategia_descendente)
-resultado_descendente = ordenamiento.ordenar_lista(lista_numeros)
-print(resultado_descendente)  # Output: [9, 8, 5, 2, 1]
+def demo():
+    # Ejemplo de uso del patrón Strategy
+    lista_numeros = [5, 2, 8, 1, 9]
+
+    # Ordenamiento ascendente
+    estrategia_ascendente = EstrategiaOrdenAscendente()
+    ordenamiento = Ordenamiento(estrategia_ascendente)
+    resultado_ascendente = ordenamiento.ordenar_lista(lista_numeros)
+    print(resultado_ascendente)  # Output: [1, 2, 5, 8, 9]
+
+    # Ordenamiento descendente
+    estrategia_descendente = EstrategiaOrdenDescendente()
+    ordenamiento.establecer_estrategia(estrategia_descendente)
+    resultado_descendente = ordenamiento.ordenar_lista(lista_numeros)
+    print(resultado_descendente)  # Output: [9, 8, 5, 2, 1]
 
 """
 En este ejemplo, tenemos la interfaz EstrategiaOrdenamiento que define el método ordenar() que será implementado por las 
@@ -75,4 +76,8 @@ ordenamiento descendente sin afectar el código del contexto Ordenamiento.
 En resumen, el patrón Strategy es útil cuando tienes algoritmos que pueden variar en su implementación y quieres 
 permitir que el cliente elija y cambie dinámicamente la estrategia que debe utilizar. Con este patrón, los algoritmos 
 se encapsulan en clases separadas, lo que promueve la flexibilidad, reutilización y extensibilidad del código.
-"""
\ No newline at end of file
+"""
+
+
+if __name__ == "__main__":
+    demo()
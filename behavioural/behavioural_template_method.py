@@ -54,20 +54,21 @@ class RecetaSopa(Receta):
     def servir(self):
         print("Sirviendo la sopa.")
 
-# Ejemplo de uso del patrón Template Method
-receta_pastel = RecetaPastel()
-receta_pastel.seguir_receta()
-# Output:
-# Preparando los ingredientes para el pastel.
-# Horneando el pastel.
-# Sirviendo el pastel.
-
-receta_sopa = RecetaSopa()
-receta_sopa.seguir_receta()
-# Output:
-# Preparando los ingredientes para la sopa.
-# Cocinando la sopa.
-# Sirviendo la sopa.
+def demo():
+    # Ejemplo de uso del patrón Template Method
+    receta_pastel = RecetaPastel()
+    receta_pastel.seguir_receta()
+    # Output:
+    # Preparando los ingredientes para el pastel.
+    # Horneando el pastel.
+    # Sirviendo el pastel.
+
+    receta_sopa = RecetaSopa()
+    receta_sopa.seguir_receta()
+    # Output:
+    # Preparando los ingredientes para la sopa.
+    # Cocinando la sopa.
+    # Sirviendo la sopa.
 
 """
 En este ejemplo, tenemos la clase base Receta, que define el esqueleto del algoritmo con los métodos 
@@ -85,4 +86,8 @@ En resumen, el patrón Template Method es útil cuando tienes un algoritmo con p
 pueden variar según las subclases. Con este patrón, puedes definir la estructura general del algoritmo en una clase 
 base, dejando que las subclases implementen los detalles específicos de cada paso. Esto promueve la reutilización del 
 código y evita duplicar la lógica común en varias subclases.
-"""
\ No newline at end of file
+"""
+
+
+if __name__ == "__main__":
+    demo()
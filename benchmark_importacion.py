@@ -0,0 +1,58 @@
+"""
+Benchmark del tiempo de importación de los patrones
+
+Importa cada paquete y cada módulo en un intérprete nuevo con python -X importtime y muestra el tiempo acumulado de
+importación. También comprueba que importar un módulo no imprime nada, es decir, que los ejemplos solo se ejecutan con
+python -m <paquete>.
+
+Uso: python benchmark_importacion.py [limite_ms]
+
+Si se indica limite_ms, el script termina con error cuando algún módulo tarda más que ese límite en importarse.
+"""
+
+import os
+import pkgutil
+import subprocess
+import sys
+
+PAQUETES = ("creational", "structural", "behavioural")
+RAIZ = os.path.dirname(os.path.abspath(__file__))
+
+
+def tiempo_importacion(modulo: str) -> tuple:
+    proceso = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {modulo}"],
+        cwd=RAIZ, capture_output=True, text=True, check=True,
+    )
+    # Formato de cada línea: "import time: <propio us> | <acumulado us> | <módulo>"
+    for linea in reversed(proceso.stderr.splitlines()):
+        propio, acumulado, nombre = linea.removeprefix("import time:").split("|")
+        if nombre.strip() == modulo:
+            return int(acumulado) / 1000, proceso.stdout
+    raise RuntimeError(f"No se encontró {modulo} en la salida de -X importtime")
+
+
+def main(argumentos: list) -> int:
+    limite_ms = float(argumentos[0]) if argumentos else None
+    errores = []
+    for paquete in PAQUETES:
+        modulos = [paquete] + [
+            f"{paquete}.{modulo.name}"
+            for modulo in pkgutil.iter_modules([os.path.join(RAIZ, paquete)])
+            if not modulo.name.startswith("_")
+        ]
+        for modulo in modulos:
+            milisegundos, salida = tiempo_importacion(modulo)
+            print(f"{modulo:<50} {milisegundos:8.2f} ms")
+            if salida:
+                errores.append(f"{modulo} imprime al importarse")
+            if limite_ms is not None and milisegundos > limite_ms:
+                errores.append(f"{modulo} supera el límite de {limite_ms} ms")
+
+    for error in errores:
+        print(error, file=sys.stderr)
+    return 1 if errores else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,61 @@
+"""
+Patrones de diseño creacionales
+
+Importar el paquete no ejecuta ningún ejemplo ni importa sus módulos: cada clase se carga la primera vez que se accede 
+a ella (por ejemplo, creational.FabricaInterfaz). Los ejemplos se ejecutan con: python -m creational [patron ...]
+"""
+
+from _paquetes import atributos_perezosos
+
+# Nombre público -> módulo del paquete que lo define
+_ATRIBUTOS = {
+    # creational_abstract_factory
+    "FabricaInterfaz": "creational_abstract_factory",
+    "FabricaInterfazWindows": "creational_abstract_factory",
+    "FabricaInterfazMacOS": "creational_abstract_factory",
+    "Boton": "creational_abstract_factory",
+    "BotonWindows": "creational_abstract_factory",
+    "BotonMacOS": "creational_abstract_factory",
+    "CuadroTexto": "creational_abstract_factory",
+    "CuadroTextoWindows": "creational_abstract_factory",
+    "CuadroTextoMacOS": "creational_abstract_factory",
+    "crear_interfaz": "creational_abstract_factory",
+    "FABRICAS_POR_PLATAFORMA": "creational_abstract_factory",
+    "resolver_fabrica": "creational_abstract_factory",
+    "PoolInterfaz": "creational_abstract_factory",
+    "obtener_pool": "creational_abstract_factory",
+    "crear_interfaz_lote": "creational_abstract_factory",
+
+    # creational_builder
+    "Computadora": "creational_builder",
+    "BuilderComputadora": "creational_builder",
+    "BuilderComputadoraBasica": "creational_builder",
+    "BuilderComputadoraAvanzada": "creational_builder",
+    "BuilderComputadoraBasicaSSD": "creational_builder",
+    "CacheConstruccion": "creational_builder",
+    "Director": "creational_builder",
+
+    # creational_factory_method
+    "Animal": "creational_factory_method",
+    "Perro": "creational_factory_method",
+    "Gato": "creational_factory_method",
+    "Loro": "creational_factory_method",
+    "Creador": "creational_factory_method",
+    "CreadorAnimales": "creational_factory_method",
+    "PoolAnimales": "creational_factory_method",
+    "interactuar_con_animal": "creational_factory_method",
+
+    # creational_prototype
+    "Producto": "creational_prototype",
+    "ProductoStore": "creational_prototype",
+    "ProductoVista": "creational_prototype",
+
+    # creational_singleton
+    "Configuracion": "creational_singleton",
+    "ConfiguracionCompartida": "creational_singleton",
+}
+
+__all__ = list(_ATRIBUTOS)
+
+
+__getattr__, __dir__ = atributos_perezosos(globals(), _ATRIBUTOS)
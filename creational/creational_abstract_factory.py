@@ -18,6 +18,10 @@ botones y cuadros de texto para cada sistema operativo, pero asegurándonos de q
 con el sistema en el que se ejecuta la aplicación.
 """
 
+import functools
+import sys
+import time
+
 # Interfaz de fábrica abstracta para botones y cuadros de texto
 class FabricaInterfaz:
     def crear_boton(self):
@@ -84,30 +88,127 @@ sistema operativo en el que se ejecuta la aplicación:
 """
 
 # Función para interactuar con la fábrica y crear los elementos de la interfaz de usuario
-def crear_interfaz(fabrica: FabricaInterfaz) -> tuple(Boton, CuadroTexto):
+def crear_interfaz(fabrica: FabricaInterfaz) -> tuple[Boton, CuadroTexto]:
     boton = fabrica.crear_boton()
     cuadro_texto = fabrica.crear_cuadro_texto()
     return boton, cuadro_texto
 
-# Ejemplo de uso en Windows
-fabrica_windows = FabricaInterfazWindows()
-boton_windows, cuadro_texto_windows = crear_interfaz(fabrica_windows)
-boton_windows.pintar()  # Output: Pintando botón en estilo Windows
-cuadro_texto_windows.mostrar()  # Output: Mostrando cuadro de texto en estilo Windows
-
-# Ejemplo de uso en macOS
-fabrica_macos = FabricaInterfazMacOS()
-boton_macos, cuadro_texto_macos = crear_interfaz(fabrica_macos)
-boton_macos.pintar()  # Output: Pintando botón en estilo macOS
-cuadro_texto_macos.mostrar()  # Output: Mostrando cuadro de texto en estilo macOS
+# Fábrica concreta que corresponde a cada valor de sys.platform
+FABRICAS_POR_PLATAFORMA = {
+    "win32": FabricaInterfazWindows,
+    "darwin": FabricaInterfazMacOS,
+}
+
+# Resuelve la fábrica de la plataforma una sola vez; las siguientes llamadas devuelven la misma instancia
+def resolver_fabrica(plataforma: str = None) -> FabricaInterfaz:
+    # La plataforma se normaliza antes de consultar la caché para que resolver_fabrica() y
+    # resolver_fabrica(sys.platform) compartan la misma fábrica
+    return _fabrica_de(plataforma or sys.platform)
+
+@functools.lru_cache(maxsize=None)
+def _fabrica_de(plataforma: str) -> FabricaInterfaz:
+    try:
+        return FABRICAS_POR_PLATAFORMA[plataforma]()
+    except KeyError:
+        raise ValueError(f"No hay fábrica de interfaz para la plataforma: {plataforma}") from None
+
+# Pool de widgets de una familia: se puede precalentar al arrancar y entregar los widgets en bloque
+class PoolInterfaz:
+    def __init__(self, fabrica: FabricaInterfaz):
+        self.fabrica = fabrica
+        self._botones = []
+        self._cuadros_texto = []
+
+    def precalentar(self, n: int):
+        faltantes = n - len(self._botones)
+        if faltantes > 0:
+            crear_boton = self.fabrica.crear_boton
+            crear_cuadro_texto = self.fabrica.crear_cuadro_texto
+            self._botones.extend([crear_boton() for _ in range(faltantes)])
+            self._cuadros_texto.extend([crear_cuadro_texto() for _ in range(faltantes)])
+
+    def crear_interfaz_lote(self, n: int) -> list:
+        if n <= 0:
+            return []
+        self.precalentar(n)
+        botones = self._botones[-n:]
+        cuadros_texto = self._cuadros_texto[-n:]
+        del self._botones[-n:]
+        del self._cuadros_texto[-n:]
+        return list(zip(botones, cuadros_texto))
+
+    def devolver(self, interfaces: list):
+        for boton, cuadro_texto in interfaces:
+            self._botones.append(boton)
+            self._cuadros_texto.append(cuadro_texto)
+
+# Un pool por familia de widgets, compartido por toda la aplicación
+def obtener_pool(plataforma: str = None) -> PoolInterfaz:
+    return _pool_de(plataforma or sys.platform)
+
+@functools.lru_cache(maxsize=None)
+def _pool_de(plataforma: str) -> PoolInterfaz:
+    return PoolInterfaz(_fabrica_de(plataforma))
+
+def crear_interfaz_lote(n: int, plataforma: str = None) -> list:
+    return obtener_pool(plataforma).crear_interfaz_lote(n)
+
+def demo():
+    # Ejemplo de uso en Windows
+    fabrica_windows = FabricaInterfazWindows()
+    boton_windows, cuadro_texto_windows = crear_interfaz(fabrica_windows)
+    boton_windows.pintar()  # Output: Pintando botón en estilo Windows
+    cuadro_texto_windows.mostrar()  # Output: Mostrando cuadro de texto en estilo Windows
+
+    # Ejemplo de uso en macOS
+    fabrica_macos = FabricaInterfazMacOS()
+    boton_macos, cuadro_texto_macos = crear_interfaz(fabrica_macos)
+    boton_macos.pintar()  # Output: Pintando botón en estilo macOS
+    cuadro_texto_macos.mostrar()  # Output: Mostrando cuadro de texto en estilo macOS
+
+    # Resolver la fábrica a partir de la plataforma y pedir varias pantallas a un pool precalentado
+    obtener_pool("darwin").precalentar(100)
+    pantallas = crear_interfaz_lote(2, "darwin")
+    for boton, cuadro_texto in pantallas:
+        boton.pintar()  # Output: Pintando botón en estilo macOS
+    obtener_pool("darwin").devolver(pantallas)
 
 """
 En este ejemplo, hemos utilizado el patrón Abstract Factory para crear los botones y cuadros de texto específicos para 
 Windows y macOS. Al utilizar la fábrica adecuada para cada sistema operativo, aseguramos que los elementos de la 
 interfaz de usuario sean compatibles con el sistema en el que se está ejecutando la aplicación.
 
+Para no elegir la fábrica a mano, resolver_fabrica() la obtiene a partir de la plataforma (sys.platform) y guarda el 
+resultado, así que la detección ocurre una sola vez. Cuando hay que construir muchas pantallas, obtener_pool() devuelve 
+un PoolInterfaz por familia que se puede precalentar al arrancar (precalentar()) y que entrega botones y cuadros de 
+texto en bloque con crear_interfaz_lote(); los widgets que ya no se usan se devuelven al pool con devolver().
+
 En resumen, el patrón Abstract Factory es útil cuando necesitas crear familias de objetos relacionados sin especificar 
 sus clases concretas. Proporciona una interfaz abstracta para crear objetos, y cada implementación concreta de esta 
 interfaz crea objetos compatibles con una determinada familia de productos. Esto permite una mayor flexibilidad y 
 extensibilidad en la creación de objetos en tu código.
-"""
\ No newline at end of file
+"""
+
+
+# Latencia de construcción de pantallas: crear_interfaz() con una fábrica nueva frente al pool precalentado
+def benchmark_pool(pantallas: int = 200_000, lote: int = 1000):
+    inicio = time.perf_counter()
+    for _ in range(pantallas):
+        crear_interfaz(FabricaInterfazWindows())
+    tiempo_sin_pool = time.perf_counter() - inicio
+
+    pool = PoolInterfaz(resolver_fabrica("win32"))
+    pool.precalentar(lote)
+    inicio = time.perf_counter()
+    for _ in range(pantallas // lote):
+        pool.devolver(pool.crear_interfaz_lote(lote))
+    tiempo_con_pool = time.perf_counter() - inicio
+
+    print(f"crear_interfaz():        {tiempo_sin_pool / pantallas * 1e9:6.0f} ns/pantalla")
+    print(f"crear_interfaz_lote():   {tiempo_con_pool / pantallas * 1e9:6.0f} ns/pantalla "
+          f"({tiempo_sin_pool / tiempo_con_pool:.1f}x)")
+
+
+if __name__ == "__main__":
+    demo()
+    benchmark_pool()
@@ -15,12 +15,21 @@ memoria, disco duro, etc. Queremos utilizar el patrón Builder para construir co
 de manera más sencilla.
 """
 
+import sys
+import time
+
 # Producto: Computadora
 class Computadora:
-    def __init__(self):
-        self.procesador = None
-        self.memoria = None
-        self.disco_duro = None
+    # Sin __dict__ por instancia: cada computadora solo guarda las referencias a sus tres componentes
+    __slots__ = ("procesador", "memoria", "disco_duro")
+
+    def __init__(self, procesador: str = None, memoria: str = None, disco_duro: str = None):
+        self.procesador = procesador
+        self.memoria = memoria
+        self.disco_duro = disco_duro
+
+    def componentes(self) -> tuple:
+        return (self.procesador, self.memoria, self.disco_duro)
 
     def __str__(self) -> str:
         return f"Computadora: Procesador={self.procesador}, Memoria={self.memoria}, Disco Duro={self.disco_duro}"
@@ -39,10 +48,14 @@ class BuilderComputadora:
     def obtener_computadora(self):
         pass
 
+    def reiniciar(self):
+        # Empieza una computadora nueva para que el builder se pueda reutilizar
+        self.computadora = Computadora()
+
 # Builder concreto para una computadora básica
 class BuilderComputadoraBasica(BuilderComputadora):
     def __init__(self):
-        self.computadora = Computadora()
+        self.reiniciar()
 
     def construir_procesador(self):
         self.computadora.procesador = "Procesador básico"
@@ -59,7 +72,7 @@ class BuilderComputadoraBasica(BuilderComputadora):
 # Builder concreto para una computadora avanzada
 class BuilderComputadoraAvanzada(BuilderComputadora):
     def __init__(self):
-        self.computadora = Computadora()
+        self.reiniciar()
 
     def construir_procesador(self):
         self.computadora.procesador = "Procesador de alto rendimiento"
@@ -73,30 +86,105 @@ class BuilderComputadoraAvanzada(BuilderComputadora):
     def obtener_computadora(self) -> Computadora:
         return self.computadora
 
+# Builder concreto que solo cambia el último paso de la computadora básica
+class BuilderComputadoraBasicaSSD(BuilderComputadoraBasica):
+    def construir_disco_duro(self):
+        self.computadora.disco_duro = "SSD 256 GB"
+
+# Caché de construcciones parciales: guarda el estado del producto después de cada prefijo de pasos
+class CacheConstruccion:
+    def __init__(self):
+        # Clave: tupla con las funciones de los pasos aplicados -> (componentes, duración del último paso)
+        self._instantaneas = {}
+        self.pasos_reutilizados = 0
+        self.pasos_ejecutados = 0
+        self.tiempo_ahorrado = 0.0
+
+    def construir(self, builder: BuilderComputadora, pasos: tuple):
+        # Los pasos se identifican por la función que los implementa: dos builders que heredan el mismo
+        # construir_procesador comparten ese prefijo. Se asume que cada paso es determinista.
+        funciones = tuple(getattr(type(builder), paso) for paso in pasos)
+        inicio_pendiente = 0
+        for longitud in range(len(funciones), 0, -1):
+            instantanea = self._instantaneas.get(funciones[:longitud])
+            if instantanea is not None:
+                # Copia al escribir: la instantánea nunca se modifica, los pasos restantes trabajan sobre una copia
+                builder.computadora = Computadora(*instantanea[0])
+                inicio_pendiente = longitud
+                self.pasos_reutilizados += longitud
+                self.tiempo_ahorrado += sum(self._instantaneas[funciones[:i]][1] for i in range(1, longitud + 1))
+                break
+
+        for indice in range(inicio_pendiente, len(funciones)):
+            inicio = time.perf_counter()
+            funciones[indice](builder)
+            duracion = time.perf_counter() - inicio
+            self.pasos_ejecutados += 1
+            self._instantaneas[funciones[:indice + 1]] = (builder.computadora.componentes(), duracion)
+
+    @property
+    def tasa_aciertos(self) -> float:
+        total = self.pasos_reutilizados + self.pasos_ejecutados
+        return self.pasos_reutilizados / total if total else 0.0
+
 # Director (opcional): Facilita la construcción de objetos
 class Director:
-    def __init__(self, builder: BuilderComputadora):
+    PASOS = ("construir_procesador", "construir_memoria", "construir_disco_duro")
+
+    def __init__(self, builder: BuilderComputadora, cache: CacheConstruccion = None):
         self.builder = builder
+        self.cache = cache
 
     def construir_computadora(self):
+        if self.cache is not None:
+            self.cache.construir(self.builder, self.PASOS)
+            return
         self.builder.construir_procesador()
         self.builder.construir_memoria()
         self.builder.construir_disco_duro()
 
-# Ejemplo de uso del patrón Builder
-builder_basico = BuilderComputadoraBasica()
-director_basico = Director(builder_basico)
-director_basico.construir_computadora()
-computadora_basica = builder_basico.obtener_computadora()
-print(computadora_basica)
-# Output: Computadora: Procesador=Procesador básico, Memoria=4 GB, Disco Duro=HDD 500 GB
-
-builder_avanzado = BuilderComputadoraAvanzada()
-director_avanzado = Director(builder_avanzado)
-director_avanzado.construir_computadora()
-computadora_avanzada = builder_avanzado.obtener_computadora()
-print(computadora_avanzada)
-# Output: Computadora: Procesador=Procesador de alto rendimiento, Memoria=16 GB, Disco Duro=SSD 1 TB
+    def construir_lote(self, n: int) -> list:
+        # Los pasos se ejecutan una sola vez; el lote se produce copiando los componentes resultantes
+        self.builder.reiniciar()
+        self.construir_computadora()
+        plantilla = self.builder.obtener_computadora()
+        # Las cadenas se internan para que todas las computadoras iguales compartan los mismos objetos
+        componentes = [
+            sys.intern(componente) if isinstance(componente, str) else componente
+            for componente in plantilla.componentes()
+        ]
+        return [Computadora(*componentes) for _ in range(n)]
+
+def demo():
+    # Ejemplo de uso del patrón Builder
+    builder_basico = BuilderComputadoraBasica()
+    director_basico = Director(builder_basico)
+    director_basico.construir_computadora()
+    computadora_basica = builder_basico.obtener_computadora()
+    print(computadora_basica)
+    # Output: Computadora: Procesador=Procesador básico, Memoria=4 GB, Disco Duro=HDD 500 GB
+
+    builder_avanzado = BuilderComputadoraAvanzada()
+    director_avanzado = Director(builder_avanzado)
+    director_avanzado.construir_computadora()
+    computadora_avanzada = builder_avanzado.obtener_computadora()
+    print(computadora_avanzada)
+    # Output: Computadora: Procesador=Procesador de alto rendimiento, Memoria=16 GB, Disco Duro=SSD 1 TB
+
+    # Construir muchas computadoras iguales con un solo builder
+    flota = director_basico.construir_lote(3)
+    print(len(flota), flota[0])
+    # Output: 3 Computadora: Procesador=Procesador básico, Memoria=4 GB, Disco Duro=HDD 500 GB
+
+    # Con una caché compartida, una variante que solo cambia el disco duro reutiliza el procesador y la memoria
+    cache = CacheConstruccion()
+    Director(BuilderComputadoraBasica(), cache).construir_computadora()
+    builder_ssd = BuilderComputadoraBasicaSSD()
+    Director(builder_ssd, cache).construir_computadora()
+    print(builder_ssd.obtener_computadora())
+    # Output: Computadora: Procesador=Procesador básico, Memoria=4 GB, Disco Duro=SSD 256 GB
+    print(f"Pasos reutilizados: {cache.pasos_reutilizados}, tasa de aciertos: {cache.tasa_aciertos:.0%}")
+    # Output: Pasos reutilizados: 2, tasa de aciertos: 33%
 
 """
 En este ejemplo, tenemos la clase Computadora, que es el producto que queremos construir con diferentes configuraciones. 
@@ -105,7 +193,16 @@ También tenemos dos implementaciones concretas de este builder: BuilderComputad
 cada uno con diferentes configuraciones de componentes de computadora.
 
 El Director es opcional y facilita la construcción de objetos utilizando un builder concreto. Ayuda a separar la lógica 
-de construcción del cliente que utiliza los builders.
+de construcción del cliente que utiliza los builders. Su método construir_lote() ejecuta los pasos una sola vez y 
+produce muchas computadoras con los mismos componentes; como Computadora usa __slots__ y las cadenas de los componentes 
+se internan, cada computadora del lote ocupa poca memoria. El método reiniciar() del builder permite reutilizarlo para 
+construir una computadora nueva.
+
+Cuando muchas configuraciones comparten los primeros pasos (por ejemplo, BuilderComputadoraBasicaSSD solo cambia el 
+disco duro de la básica), el Director puede recibir una CacheConstruccion. La caché guarda el estado del producto 
+después de cada prefijo de pasos, identificado por las funciones que implementan esos pasos; una construcción que 
+comparte un prefijo parte de una copia de ese estado y solo ejecuta los pasos restantes. Los contadores 
+pasos_reutilizados, pasos_ejecutados, tasa_aciertos y tiempo_ahorrado muestran cuánto trabajo se evitó.
 
 Finalmente, creamos dos computadoras diferentes usando los builders concretos. Cada computadora se construye paso a paso 
 según su configuración, y el resultado es dos computadoras con diferentes especificaciones.
@@ -114,4 +211,99 @@ En resumen, el patrón Builder es útil cuando tienes un objeto complejo con muc
  Divide el proceso de construcción en pasos manejables y personalizables, lo que facilita la creación de diferentes 
  variantes del mismo objeto. Además, el patrón Builder promueve un código más limpio y flexible al evitar constructores 
  con muchos parámetros y opciones.
-"""
\ No newline at end of file
+"""
+
+
+
+# Memoria y rendimiento: una computadora con __dict__ construida paso a paso frente a construir_lote()
+def benchmark_lote(n: int = 200_000):
+    import tracemalloc
+
+    class ComputadoraConDict:
+        def __init__(self, procesador=None, memoria=None, disco_duro=None):
+            self.procesador = procesador
+            self.memoria = memoria
+            self.disco_duro = disco_duro
+
+    tracemalloc.start()
+    con_dict = [ComputadoraConDict("Procesador básico", "4 GB", "HDD 500 GB") for _ in range(n)]
+    memoria_dict = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del con_dict
+
+    director = Director(BuilderComputadoraBasica())
+    tracemalloc.start()
+    lote = director.construir_lote(n)
+    memoria_slots = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del lote
+
+    inicio = time.perf_counter()
+    for _ in range(n):
+        builder = BuilderComputadoraBasica()
+        Director(builder).construir_computadora()
+        builder.obtener_computadora()
+    tiempo_pasos = time.perf_counter() - inicio
+
+    inicio = time.perf_counter()
+    director.construir_lote(n)
+    tiempo_lote = time.perf_counter() - inicio
+
+    print(f"Computadora con __dict__: {memoria_dict / n:.1f} bytes/computadora")
+    print(f"Computadora con __slots__: {memoria_slots / n:.1f} bytes/computadora")
+    print(f"Paso a paso:      {n / tiempo_pasos:>12,.0f} computadoras/s")
+    print(f"construir_lote(): {n / tiempo_lote:>12,.0f} computadoras/s ({tiempo_pasos / tiempo_lote:.1f}x)")
+
+
+# Construcciones con pasos costosos que comparten prefijo, con y sin CacheConstruccion
+def benchmark_cache(variantes: int = 50, latencia: float = 0.001):
+    class BuilderLento(BuilderComputadora):
+        def __init__(self):
+            self.reiniciar()
+
+        def construir_procesador(self):
+            time.sleep(latencia)
+            self.computadora.procesador = "Procesador básico"
+
+        def construir_memoria(self):
+            time.sleep(latencia)
+            self.computadora.memoria = "4 GB"
+
+        def construir_disco_duro(self):
+            time.sleep(latencia)
+            self.computadora.disco_duro = "HDD 500 GB"
+
+        def obtener_computadora(self) -> Computadora:
+            return self.computadora
+
+    # Variantes que solo difieren en el último paso
+    def variante(i: int):
+        class BuilderVariante(BuilderLento):
+            def construir_disco_duro(self):
+                self.computadora.disco_duro = f"Disco {i}"
+        return BuilderVariante
+
+    clases = [variante(i) for i in range(variantes)]
+    # Cada variante se construye varias veces
+    construcciones = [clase for clase in clases for _ in range(4)]
+
+    inicio = time.perf_counter()
+    for clase in construcciones:
+        Director(clase()).construir_computadora()
+    tiempo_sin_cache = time.perf_counter() - inicio
+
+    cache = CacheConstruccion()
+    inicio = time.perf_counter()
+    for clase in construcciones:
+        Director(clase(), cache).construir_computadora()
+    tiempo_con_cache = time.perf_counter() - inicio
+
+    print(f"Sin caché: {tiempo_sin_cache * 1000:.1f} ms")
+    print(f"Con caché: {tiempo_con_cache * 1000:.1f} ms, tasa de aciertos {cache.tasa_aciertos:.0%}, "
+          f"tiempo ahorrado estimado {cache.tiempo_ahorrado * 1000:.1f} ms")
+
+
+if __name__ == "__main__":
+    demo()
+    benchmark_lote()
+    benchmark_cache()
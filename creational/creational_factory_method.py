@@ -18,35 +18,174 @@ Supongamos que tenemos una clase abstracta Animal que define un método hacer_so
 concretas Perro y Gato, cada una representando un tipo diferente de animal.
 """
 
+import importlib
+import itertools
+import random
+import time
+
 # Clase base (Producto)
 class Animal:
+    # Los productos sin estado pueden compartir una única instancia (flyweight)
+    sin_estado = False
+
     def hacer_sonido(self):
         pass
 
+    def reiniciar(self):
+        # Restablece el estado de un animal antes de devolverlo a un pool
+        pass
+
 # Subclase concreta (Producto)
 class Perro(Animal):
+    sin_estado = True
+
     def hacer_sonido(self):
         return "Guau!"
 
 # Subclase concreta (Producto)
 class Gato(Animal):
+    sin_estado = True
+
     def hacer_sonido(self):
         return "Miau!"
 
+# Subclase concreta (Producto) con estado: no se comparte, pero se puede reutilizar mediante un pool
+class Loro(Animal):
+    def __init__(self):
+        self.frases = []
+
+    def aprender(self, frase: str):
+        self.frases.append(frase)
+
+    def hacer_sonido(self):
+        return self.frases[-1] if self.frases else "Cruac!"
+
+    def reiniciar(self):
+        self.frases.clear()
+
 # Clase creadora abstracta (Creator)
 class Creador:
     def crear_animal(self):
         pass
 
+# Constructor perezoso: importa la clase del plugin la primera vez que se pide su tipo
+class _CargaPerezosa:
+    def __init__(self, registro: dict, tipo_animal: str, cargar):
+        # Registros que contienen esta carga: el de la clase que la registró y las copias de sus subclases
+        self.registros = [registro]
+        self.tipo_animal = tipo_animal
+        self.cargar = cargar
+        self.constructor = None
+
+    def __call__(self):
+        constructor = self.constructor
+        if constructor is None:
+            # Se resuelve una sola vez, así que todas las copias comparten la misma instancia de un tipo sin estado
+            constructor = self.constructor = _constructor_para(self.cargar())
+            # Se reemplaza a sí mismo en cada registro que aún lo contiene para que las siguientes creaciones no pasen
+            # por aquí; si una subclase ya registró otro constructor para el tipo, se respeta
+            for registro in self.registros:
+                if registro.get(self.tipo_animal) is self:
+                    registro[self.tipo_animal] = constructor
+        return constructor()
+
+def _constructor_para(clase):
+    # Para clases sin estado, el constructor devuelve siempre la misma instancia sin crear objetos nuevos
+    if getattr(clase, "sin_estado", False):
+        return itertools.repeat(clase()).__next__
+    return clase
+
+def _importar_ruta(ruta: str):
+    # Acepta "paquete.modulo:Clase" o "paquete.modulo.Clase"
+    modulo, _, atributo = ruta.partition(":") if ":" in ruta else ruta.rpartition(".")
+    return getattr(importlib.import_module(modulo), atributo)
+
 # Subclase creadora concreta (Creator)
 class CreadorAnimales(Creador):
+    # Registro de tipos: clave del tipo -> constructor
+    _registro = {}
+
+    @classmethod
+    def _registro_propio(cls) -> dict:
+        # Cada subclase que registra tipos obtiene su propia copia del registro
+        if "_registro" not in cls.__dict__:
+            cls._registro = registro = dict(cls._registro)
+            # Las cargas perezosas heredadas también deben resolverse en la copia
+            for constructor in registro.values():
+                if isinstance(constructor, _CargaPerezosa):
+                    constructor.registros.append(registro)
+        return cls._registro
+
+    @classmethod
+    def registrar(cls, tipo_animal: str, constructor):
+        cls._registro_propio()[tipo_animal] = _constructor_para(constructor)
+        return constructor
+
+    @classmethod
+    def registrar_perezoso(cls, tipo_animal: str, ruta: str):
+        registro = cls._registro_propio()
+        registro[tipo_animal] = _CargaPerezosa(registro, tipo_animal, lambda: _importar_ruta(ruta))
+
+    @classmethod
+    def registrar_entry_points(cls, grupo: str = "design_patterns.animales"):
+        # Los plugins instalados declaran sus animales como entry points; no se importan hasta que se usan
+        # importlib.metadata es costoso de importar, así que solo se carga si se usan entry points
+        from importlib import metadata
+
+        registro = cls._registro_propio()
+        for entry_point in metadata.entry_points(group=grupo):
+            registro[entry_point.name] = _CargaPerezosa(registro, entry_point.name, entry_point.load)
+
     def crear_animal(self, tipo_animal: str) -> Animal:
-        if tipo_animal == "perro":
-            return Perro()
-        elif tipo_animal == "gato":
-            return Gato()
-        else:
-            raise ValueError(f"Tipo de animal desconocido: {tipo_animal}")
+        try:
+            constructor = self._registro[tipo_animal]
+        except KeyError:
+            raise ValueError(f"Tipo de animal desconocido: {tipo_animal}") from None
+        return constructor()
+
+    def crear_animales(self, tipos_animales) -> list:
+        # Creación en bloque: una sola búsqueda de atributos para todo el flujo de tipos
+        registro = self._registro
+        try:
+            return [registro[tipo_animal]() for tipo_animal in tipos_animales]
+        except KeyError as error:
+            raise ValueError(f"Tipo de animal desconocido: {error.args[0]}") from None
+
+CreadorAnimales.registrar("perro", Perro)
+CreadorAnimales.registrar("gato", Gato)
+CreadorAnimales.registrar("loro", Loro)
+
+# Pool de objetos para animales con estado: adquirir() reutiliza animales liberados en lugar de crear nuevos
+class PoolAnimales:
+    def __init__(self, creador: CreadorAnimales, tamano_maximo: int = 1024):
+        self.creador = creador
+        self.tamano_maximo = tamano_maximo
+        self._clases = {}
+        # Clase -> animales libres, indexados por id() para que un mismo animal no se pueda guardar dos veces; el
+        # diccionario conserva el orden, así que popitem() devuelve el último animal liberado
+        self._libres = {}
+        self.creados = 0
+        self.reutilizados = 0
+
+    def adquirir(self, tipo_animal: str) -> Animal:
+        libres = self._libres.get(self._clases.get(tipo_animal))
+        if libres:
+            self.reutilizados += 1
+            return libres.popitem()[1]
+        animal = self.creador.crear_animal(tipo_animal)
+        self._clases[tipo_animal] = type(animal)
+        self.creados += 1
+        return animal
+
+    def liberar(self, animal: Animal):
+        # Las instancias compartidas (sin estado) no pertenecen al pool
+        if animal.sin_estado:
+            return
+        libres = self._libres.setdefault(type(animal), {})
+        # Liberar dos veces el mismo animal no tiene efecto: si no, dos adquisiciones devolverían el mismo objeto
+        if len(libres) < self.tamano_maximo and id(animal) not in libres:
+            animal.reiniciar()
+            libres[id(animal)] = animal
 
 # Función para interactuar con el Creador y los Productos
 def interactuar_con_animal(creador: CreadorAnimales, tipo_animal: str):
@@ -54,15 +193,34 @@ def interactuar_con_animal(creador: CreadorAnimales, tipo_animal: str):
     sonido = animal.hacer_sonido()
     print(f"El {tipo_animal} hace: {sonido}")
 
-# Crear un Creador de animales
-creador_animales = CreadorAnimales()
+def demo():
+    # Crear un Creador de animales
+    creador_animales = CreadorAnimales()
 
-# Interactuar con los animales creados por el Creador
-interactuar_con_animal(creador_animales, "perro")
-# Output: El perro hace: Guau!
+    # Interactuar con los animales creados por el Creador
+    interactuar_con_animal(creador_animales, "perro")
+    # Output: El perro hace: Guau!
 
-interactuar_con_animal(creador_animales, "gato")
-# Output: El gato hace: Miau!
+    interactuar_con_animal(creador_animales, "gato")
+    # Output: El gato hace: Miau!
+
+    # Registrar un nuevo tipo a partir de una ruta: el módulo solo se importa cuando se pide el tipo por primera vez
+    CreadorAnimales.registrar_perezoso("gato_de_plugin", f"{__name__}:Gato")
+    interactuar_con_animal(creador_animales, "gato_de_plugin")
+    # Output: El gato_de_plugin hace: Miau!
+
+    # Crear animales en bloque: Perro y Gato no tienen estado, así que se reutiliza la misma instancia
+    animales = creador_animales.crear_animales(["perro", "gato", "perro"])
+    print([animal.hacer_sonido() for animal in animales], animales[0] is animales[2])
+    # Output: ['Guau!', 'Miau!', 'Guau!'] True
+
+    # Los animales con estado se toman prestados de un pool y se devuelven al terminar
+    pool = PoolAnimales(creador_animales)
+    loro = pool.adquirir("loro")
+    loro.aprender("Hola!")
+    print(loro.hacer_sonido())  # Output: Hola!
+    pool.liberar(loro)
+    print(pool.adquirir("loro") is loro, loro.hacer_sonido())  # Output: True Cruac!
 
 """
 En este ejemplo, tenemos la clase abstracta Animal que define un método hacer_sonido() y dos subclases concretas Perro y 
@@ -71,6 +229,17 @@ Gato, cada una representando un tipo diferente de animal.
 Luego, definimos la clase creadora abstracta Creador, que tiene el Factory Method crear_animal(). Las subclases 
 concretas de Creador implementan este Factory Method y deciden qué tipo de objeto Animal crear.
 
+CreadorAnimales no usa una cadena de if/elif, sino un registro (un diccionario) que asocia cada tipo con su 
+constructor, así que elegir la clase cuesta lo mismo con dos tipos que con cientos. Los tipos se agregan con 
+registrar(). Con registrar_perezoso() (una ruta "modulo:Clase") o registrar_entry_points() (plugins instalados), la 
+clase solo se importa la primera vez que se pide su tipo.
+
+Perro y Gato no tienen estado, por lo que declaran sin_estado = True y el registro guarda una única instancia 
+compartida (flyweight) en lugar de crear una nueva en cada llamada. crear_animales() crea los animales de todo un 
+flujo de tipos de una vez. Para animales con estado, como Loro, PoolAnimales reutiliza instancias: adquirir() entrega 
+un animal libre (o crea uno si no hay) y liberar() lo reinicia y lo devuelve al pool. Liberar dos veces el mismo animal 
+no tiene efecto.
+
 Finalmente, tenemos la función interactuar_con_animal() que toma un creador y un tipo de animal como argumentos y 
 utiliza el Factory Method para crear el animal correspondiente. Luego, se muestra el sonido que hace el animal.
 
@@ -81,4 +250,87 @@ Factory Method para crear ese nuevo tipo de animal.
 En resumen, el patrón Factory Method es útil cuando tienes una clase abstracta que necesita crear objetos, pero deseas 
 delegar la responsabilidad de la creación a sus subclases. Esto permite una mayor flexibilidad y extensibilidad en la 
 creación de objetos en tu código.
-"""
\ No newline at end of file
+"""
+
+
+# Rendimiento de creación con 10, 100 y 1000 tipos registrados frente a una cadena de comparaciones
+def benchmark_registro(creaciones: int = 200_000):
+    for cantidad in (10, 100, 1000):
+        class CreadorPrueba(CreadorAnimales):
+            _registro = {}
+
+        tipos = [f"animal{i}" for i in range(cantidad)]
+        for tipo in tipos:
+            CreadorPrueba.registrar(tipo, type(tipo.capitalize(), (Animal,), {}))
+        cadena = list(CreadorPrueba._registro.items())
+        claves = [random.choice(tipos) for _ in range(creaciones)]
+
+        def crear_con_comparaciones(tipo_animal):
+            for tipo, constructor in cadena:
+                if tipo == tipo_animal:
+                    return constructor()
+
+        inicio = time.perf_counter()
+        for tipo in claves:
+            crear_con_comparaciones(tipo)
+        tiempo_comparaciones = time.perf_counter() - inicio
+
+        creador = CreadorPrueba()
+        inicio = time.perf_counter()
+        for tipo in claves:
+            creador.crear_animal(tipo)
+        tiempo_registro = time.perf_counter() - inicio
+
+        print(f"{cantidad:>4} tipos: comparaciones {creaciones / tiempo_comparaciones:>12,.0f} animales/s, "
+              f"registro {creaciones / tiempo_registro:>12,.0f} animales/s")
+
+
+# Asignaciones y rendimiento: instancias nuevas frente a flyweight (sin estado) y pool (con estado)
+def benchmark_reutilizacion(creaciones: int = 1_000_000):
+    asignaciones = itertools.count()
+
+    class PerroContado(Perro):
+        sin_estado = False
+
+        def __init__(self):
+            next(asignaciones)
+
+    class PerroCompartido(PerroContado):
+        sin_estado = True
+
+    class LoroContado(Loro):
+        def __init__(self):
+            next(asignaciones)
+            super().__init__()
+
+    class CreadorPrueba(CreadorAnimales):
+        _registro = {}
+
+    CreadorPrueba.registrar("perro_nuevo", PerroContado)
+    CreadorPrueba.registrar("perro_compartido", PerroCompartido)
+    CreadorPrueba.registrar("loro", LoroContado)
+    creador = CreadorPrueba()
+    pool = PoolAnimales(creador)
+
+    def medir(nombre, crear):
+        inicio_asignaciones = next(asignaciones)
+        inicio = time.perf_counter()
+        crear()
+        duracion = time.perf_counter() - inicio
+        creados = next(asignaciones) - inicio_asignaciones - 1
+        print(f"{nombre}: {creaciones / duracion:>12,.0f} animales/s, {creados:,} instancias creadas")
+
+    def usar_pool():
+        adquirir, liberar = pool.adquirir, pool.liberar
+        for _ in range(creaciones):
+            liberar(adquirir("loro"))
+
+    medir("Instancia nueva por tipo", lambda: creador.crear_animales(itertools.repeat("perro_nuevo", creaciones)))
+    medir("Flyweight (sin estado)  ", lambda: creador.crear_animales(itertools.repeat("perro_compartido", creaciones)))
+    medir("Pool (con estado)       ", usar_pool)
+
+
+if __name__ == "__main__":
+    demo()
+    benchmark_registro()
+    benchmark_reutilizacion()
@@ -14,47 +14,241 @@ Supongamos que tenemos una clase Producto que representa un objeto complejo con
 """
 
 import copy
+import time
+from array import array
 
 # Clase base: Prototipo (Producto)
 class Producto:
+    # Atributos inmutables: el clon comparte la referencia en lugar de copiarla
+    _campos_inmutables = frozenset(("nombre", "precio", "descripcion"))
+
     def __init__(self, nombre: str, precio: int, descripcion: str):
         self.nombre = nombre
         self.precio = precio
         self.descripcion = descripcion
 
-    def clonar(self) -> copy:
-        return copy.deepcopy(self)
+    def clonar(self) -> "Producto":
+        clon = self.__class__.__new__(self.__class__)
+        clon.__dict__.update(self.__dict__)
+        # Solo los atributos mutables (los que no están en _campos_inmutables) se copian en profundidad. Todos comparten
+        # el mismo memo, así que dos atributos que apuntan al mismo objeto siguen compartiendo su copia, como con
+        # copy.deepcopy(self)
+        memo = {id(self): clon}
+        for campo, valor in self.__dict__.items():
+            if campo not in self._campos_inmutables:
+                clon.__dict__[campo] = copy.deepcopy(valor, memo)
+        return clon
+
+    def clonar_lote(self, n: int, **overrides) -> list:
+        # El estado base se calcula una sola vez para todo el lote
+        base = dict(self.__dict__)
+        base.update(overrides)
+        mutables = [campo for campo in base if campo not in self._campos_inmutables]
+        cls = self.__class__
+        clones = []
+        for _ in range(n):
+            clon = cls.__new__(cls)
+            estado = clon.__dict__
+            estado.update(base)
+            # Un memo por clon, compartido por todos sus atributos mutables
+            memo = {id(self): clon}
+            for campo in mutables:
+                estado[campo] = copy.deepcopy(base[campo], memo)
+            clones.append(clon)
+        return clones
+
+# Almacén columnar de productos: cada atributo se guarda en una columna en lugar de un objeto por producto
+class ProductoStore:
+    def __init__(self):
+        self._precios = array("d")
+        # Nombres y descripciones se guardan como índices a una tabla de cadenas sin repetidos
+        self._nombres = array("I")
+        self._descripciones = array("I")
+        self._cadenas = []
+        self._indices_cadenas = {}
+
+    def _indice_cadena(self, cadena: str) -> int:
+        indice = self._indices_cadenas.get(cadena)
+        if indice is None:
+            indice = len(self._cadenas)
+            self._cadenas.append(cadena)
+            self._indices_cadenas[cadena] = indice
+        return indice
+
+    def agregar(self, nombre: str, precio: float, descripcion: str) -> "ProductoVista":
+        self._nombres.append(self._indice_cadena(nombre))
+        self._precios.append(precio)
+        self._descripciones.append(self._indice_cadena(descripcion))
+        return ProductoVista(self, len(self._precios) - 1)
+
+    def agregar_clones(self, prototipo: Producto, n: int):
+        # Equivalente columnar de clonar_lote(): n filas que comparten las cadenas del prototipo
+        self._nombres.extend(array("I", [self._indice_cadena(prototipo.nombre)]) * n)
+        self._precios.extend(array("d", [prototipo.precio]) * n)
+        self._descripciones.extend(array("I", [self._indice_cadena(prototipo.descripcion)]) * n)
+
+    def ajustar_precios(self, factor: float):
+        # Actualización masiva de la columna de precios, sin crear objetos Producto
+        if not self._precios:
+            return
+        try:
+            # NumPy es opcional: si está instalado, multiplica el buffer del array en una sola operación y en el lugar
+            import numpy
+        except ImportError:
+            self._precios = array("d", [precio * factor for precio in self._precios])
+        else:
+            precios = numpy.frombuffer(self._precios, dtype=numpy.float64)
+            numpy.multiply(precios, factor, out=precios)
+
+    def __len__(self) -> int:
+        return len(self._precios)
+
+    def __getitem__(self, indice: int) -> "ProductoVista":
+        if indice < 0:
+            indice += len(self)
+        if not 0 <= indice < len(self):
+            raise IndexError("índice de producto fuera de rango")
+        return ProductoVista(self, indice)
+
+    def __iter__(self):
+        for indice in range(len(self)):
+            yield ProductoVista(self, indice)
+
+# Vista ligera de una fila del almacén que se comporta como un Producto
+class ProductoVista:
+    __slots__ = ("_store", "_indice")
+
+    def __init__(self, store: ProductoStore, indice: int):
+        self._store = store
+        self._indice = indice
+
+    @property
+    def nombre(self) -> str:
+        return self._store._cadenas[self._store._nombres[self._indice]]
+
+    @nombre.setter
+    def nombre(self, valor: str):
+        self._store._nombres[self._indice] = self._store._indice_cadena(valor)
+
+    @property
+    def precio(self) -> float:
+        return self._store._precios[self._indice]
+
+    @precio.setter
+    def precio(self, valor: float):
+        self._store._precios[self._indice] = valor
+
+    @property
+    def descripcion(self) -> str:
+        return self._store._cadenas[self._store._descripciones[self._indice]]
+
+    @descripcion.setter
+    def descripcion(self, valor: str):
+        self._store._descripciones[self._indice] = self._store._indice_cadena(valor)
+
+    def clonar(self) -> Producto:
+        return Producto(self.nombre, self.precio, self.descripcion)
 
-# Ejemplo de uso del patrón Prototype
-producto_prototipo = Producto("Producto básico", 100, "Este es un producto básico")
+def demo():
+    # Ejemplo de uso del patrón Prototype
+    producto_prototipo = Producto("Producto básico", 100, "Este es un producto básico")
 
-# Crear una copia del prototipo y ajustar atributos según sea necesario
-producto_personalizado = producto_prototipo.clonar()
-producto_personalizado.nombre = "Producto personalizado"
-producto_personalizado.precio = 150
-producto_personalizado.descripcion = "Este es un producto personalizado"
+    # Crear una copia del prototipo y ajustar atributos según sea necesario
+    producto_personalizado = producto_prototipo.clonar()
+    producto_personalizado.nombre = "Producto personalizado"
+    producto_personalizado.precio = 150
+    producto_personalizado.descripcion = "Este es un producto personalizado"
 
-# Mostrar los productos
-print(producto_prototipo.nombre, producto_prototipo.precio, producto_prototipo.descripcion)
-# Output: Producto básico 100 Este es un producto básico
+    # Mostrar los productos
+    print(producto_prototipo.nombre, producto_prototipo.precio, producto_prototipo.descripcion)
+    # Output: Producto básico 100 Este es un producto básico
 
-print(producto_personalizado.nombre, producto_personalizado.precio, producto_personalizado.descripcion)
-# Output: Producto personalizado 150 Este es un producto personalizado
+    print(producto_personalizado.nombre, producto_personalizado.precio, producto_personalizado.descripcion)
+    # Output: Producto personalizado 150 Este es un producto personalizado
+
+    # Crear muchas copias del prototipo de una sola vez, ajustando atributos comunes a todo el lote
+    productos_oferta = producto_prototipo.clonar_lote(3, precio=80)
+    print([(producto.nombre, producto.precio) for producto in productos_oferta])
+    # Output: [('Producto básico', 80), ('Producto básico', 80), ('Producto básico', 80)]
+
+    # Guardar muchas variantes del prototipo en un almacén columnar y subir todos los precios un 10%
+    catalogo = ProductoStore()
+    catalogo.agregar_clones(producto_prototipo, 3)
+    catalogo.ajustar_precios(1.10)
+    print(catalogo[0].nombre, round(catalogo[0].precio, 2), len(catalogo))
+    # Output: Producto básico 110.0 3
 
 """
 En este ejemplo, hemos definido la clase Producto, que es el prototipo que queremos clonar. La clase tiene un método 
-clonar() que utiliza la función deepcopy del módulo copy para crear una copia profunda del objeto, incluidos todos sus 
-atributos.
+clonar() que crea una copia del objeto. Como nombre, precio y descripcion son inmutables, el clon comparte esas 
+referencias con el prototipo y solo los atributos mutables se copian en profundidad con la función deepcopy del módulo 
+copy. El método clonar_lote() crea muchas copias de una vez, calculando el estado base una sola vez para todo el lote.
 
 Luego, creamos un producto_prototipo, que es una instancia del prototipo original con atributos predeterminados.
 
 A continuación, utilizamos el método clonar() para crear una copia del prototipo, que llamamos producto_personalizado. 
 Luego, ajustamos algunos atributos específicos en la copia personalizada.
 
+Para catálogos muy grandes, ProductoStore guarda los productos en columnas (array de precios y tablas de cadenas sin 
+repetidos para nombres y descripciones) y devuelve vistas ligeras (ProductoVista) que se comportan como un Producto. 
+Así, millones de variantes no necesitan un objeto con __dict__ cada una y los precios se pueden ajustar en bloque.
+
 Como resultado, tenemos dos objetos, producto_prototipo y producto_personalizado, que son similares pero tienen 
 atributos diferentes.
 
 En resumen, el patrón Prototype es útil cuando necesitas crear objetos complejos y quieres evitar la duplicación de 
 código o la configuración manual de atributos en cada instancia nueva. Clonar un prototipo existente te permite crear 
 nuevas instancias eficientemente, personalizando solo los atributos necesarios en cada copia.
-"""
\ No newline at end of file
+"""
+
+
+# Comparación de rendimiento entre clonar() y copy.deepcopy()
+def benchmark_clonacion(n: int = 100_000):
+    prototipo = Producto("Producto básico", 100, "Este es un producto básico")
+
+    inicio = time.perf_counter()
+    for _ in range(n):
+        copy.deepcopy(prototipo)
+    tiempo_deepcopy = time.perf_counter() - inicio
+
+    inicio = time.perf_counter()
+    for _ in range(n):
+        prototipo.clonar()
+    tiempo_clonar = time.perf_counter() - inicio
+
+    inicio = time.perf_counter()
+    prototipo.clonar_lote(n)
+    tiempo_lote = time.perf_counter() - inicio
+
+    print(f"copy.deepcopy: {n / tiempo_deepcopy:,.0f} clones/s")
+    print(f"clonar():      {n / tiempo_clonar:,.0f} clones/s ({tiempo_deepcopy / tiempo_clonar:.1f}x)")
+    print(f"clonar_lote(): {n / tiempo_lote:,.0f} clones/s ({tiempo_deepcopy / tiempo_lote:.1f}x)")
+
+
+# Comparación de memoria entre una lista de Producto y un ProductoStore
+def reporte_memoria(n: int = 100_000):
+    import tracemalloc
+
+    prototipo = Producto("Producto básico", 100, "Este es un producto básico")
+
+    tracemalloc.start()
+    productos = prototipo.clonar_lote(n)
+    memoria_lista = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del productos
+
+    tracemalloc.start()
+    catalogo = ProductoStore()
+    catalogo.agregar_clones(prototipo, n)
+    memoria_store = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del catalogo
+
+    print(f"list[Producto]: {memoria_lista / n:.1f} bytes/producto")
+    print(f"ProductoStore:  {memoria_store / n:.1f} bytes/producto ({memoria_lista / memoria_store:.1f}x menos)")
+
+
+if __name__ == "__main__":
+    demo()
+    benchmark_clonacion()
+    reporte_memoria()
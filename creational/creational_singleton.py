@@ -9,37 +9,182 @@ haya una instancia de esta clase en todo el programa y que todas las partes del
 misma instancia de configuración.
 """
 
+import json
+import os
+import struct
+import sys
+import threading
+import time
+
 class Configuracion:
     _instancia = None
+    _lock = threading.Lock()
 
     def __new__(cls):
-        if cls._instancia is None:
-            cls._instancia = super(Configuracion, cls).__new__(cls)
-            cls._instancia.__initialized = False
-        return cls._instancia
+        instancia = cls._instancia
+        # Lectura sin lock: una vez creada la instancia, las llamadas posteriores no compiten por el lock
+        if instancia is None:
+            with cls._lock:
+                if cls._instancia is None:
+                    instancia = super(Configuracion, cls).__new__(cls)
+                    # Aquí se pueden inicializar los atributos de configuración
+                    instancia.opcion1 = None
+                    instancia.opcion2 = None
+                    # La instancia se publica solo cuando ya está inicializada
+                    cls._instancia = instancia
+                instancia = cls._instancia
+        return instancia
+
+    @classmethod
+    def obtener(cls) -> "Configuracion":
+        # Acceso ligero que evita pasar por __new__ y __init__ cuando la instancia ya existe
+        instancia = cls._instancia
+        if instancia is None:
+            instancia = cls()
+        return instancia
+
+# Configuración compartida entre procesos mediante un segmento de memoria compartida
+class ConfiguracionCompartida:
+    # Cabecera del segmento: contador de versión y longitud de los datos (JSON) que le siguen
+    _CABECERA = struct.Struct("<QI")
+    _TAMANO = 4096
+    # Reintentos de lectura mientras hay una escritura en curso
+    _MAX_INTENTOS = 64
+    _INTENTOS_SIN_ESPERA = 8
+    _ESPERA_INICIAL = 1e-6
+    _ESPERA_MAXIMA = 1e-3
+    _lock_registro = threading.Lock()
+
+    def __init__(self, nombre: str, crear: bool = False):
+        # multiprocessing se importa aquí para no encarecer la importación del módulo a quien solo usa Configuracion
+        from multiprocessing import shared_memory
+
+        if crear:
+            self._memoria = shared_memory.SharedMemory(name=nombre, create=True, size=self._TAMANO)
+        else:
+            self._memoria = self._abrir_sin_registrar(shared_memory, nombre)
+        self._buffer = self._memoria.buf
+        self._version = None
+        self._valores = {}
+        if crear:
+            self.escribir(opcion1=None, opcion2=None)
+
+    @classmethod
+    def _abrir_sin_registrar(cls, shared_memory, nombre: str):
+        # Solo el proceso creador es dueño del segmento. Si un lector lo registrara en su resource_tracker, al terminar
+        # ese lector se borraría el segmento que siguen usando los demás procesos; y si comparte el resource_tracker
+        # con el creador (procesos hijos de multiprocessing), anular el registro después borraría el del creador
+        if sys.version_info >= (3, 13):
+            return shared_memory.SharedMemory(name=nombre, track=False)
+        resource_tracker = shared_memory.resource_tracker
+        with cls._lock_registro:
+            registrar = resource_tracker.register
+            resource_tracker.register = lambda nombre, tipo: None
+            try:
+                return shared_memory.SharedMemory(name=nombre)
+            finally:
+                resource_tracker.register = registrar
+
+    def _leer(self) -> dict:
+        buffer = self._buffer
+        version = self._CABECERA.unpack_from(buffer)[0]
+        # Mientras la versión no cambie, se devuelven los valores ya decodificados sin tocar el segmento
+        if version == self._version:
+            return self._valores
+        espera = self._ESPERA_INICIAL
+        for intento in range(self._MAX_INTENTOS):
+            version, longitud = self._CABECERA.unpack_from(buffer)
+            # Una versión impar indica que hay una escritura en curso
+            if version % 2 == 0:
+                datos = bytes(buffer[self._CABECERA.size:self._CABECERA.size + longitud])
+                if self._CABECERA.unpack_from(buffer)[0] == version:
+                    break
+            # Los primeros reintentos son inmediatos; después se cede la CPU con una espera que se va duplicando
+            if intento >= self._INTENTOS_SIN_ESPERA:
+                time.sleep(espera)
+                espera = min(espera * 2, self._ESPERA_MAXIMA)
+        else:
+            # Un escritor bloqueado a mitad de escritura no deja colgados a los lectores: se devuelven los últimos
+            # valores leídos correctamente, y si nunca hubo ninguno se avisa del fallo
+            if self._version is not None:
+                return self._valores
+            raise TimeoutError("No se pudo leer una versión consistente de la configuración compartida")
+        self._valores = json.loads(datos) if datos else {}
+        self._version = version
+        return self._valores
+
+    def escribir(self, **valores):
+        # Solo debe haber un proceso escritor; los lectores nunca se bloquean
+        nuevos = dict(self._leer())
+        nuevos.update(valores)
+        datos = json.dumps(nuevos).encode()
+        if self._CABECERA.size + len(datos) > self._TAMANO:
+            raise ValueError("La configuración no cabe en el segmento de memoria compartida")
+        buffer = self._buffer
+        version = self._CABECERA.unpack_from(buffer)[0]
+        self._CABECERA.pack_into(buffer, 0, version + 1, 0)
+        buffer[self._CABECERA.size:self._CABECERA.size + len(datos)] = datos
+        self._CABECERA.pack_into(buffer, 0, version + 2, len(datos))
+
+    def recargar_desde_archivo(self, ruta: str):
+        # Recarga en caliente: los procesos lectores ven los nuevos valores en su siguiente lectura
+        with open(ruta, encoding="utf-8") as archivo:
+            self.escribir(**json.load(archivo))
 
-    def __init__(self):
-        if not self.__initialized:
-            # Aquí se pueden inicializar los atributos de configuración
-            self.opcion1 = None
-            self.opcion2 = None
-            self.__initialized = True
+    @property
+    def version(self) -> int:
+        return self._CABECERA.unpack_from(self._buffer)[0]
 
-# Ejemplo de uso del Singleton
-configuracion1 = Configuracion()
-configuracion1.opcion1 = "valor1"
+    @property
+    def opcion1(self):
+        return self._leer().get("opcion1")
 
-configuracion2 = Configuracion()
-print(configuracion2.opcion1)  # Output: valor1
+    @property
+    def opcion2(self):
+        return self._leer().get("opcion2")
+
+    def cerrar(self):
+        # Hay que soltar la vista del buffer antes de cerrar el segmento
+        self._buffer.release()
+        self._memoria.close()
+
+    def destruir(self):
+        # Solo lo debe llamar el proceso que creó el segmento; los lectores únicamente llaman a cerrar()
+        self.cerrar()
+        self._memoria.unlink()
+
+def demo():
+    # Ejemplo de uso del Singleton
+    configuracion1 = Configuracion()
+    configuracion1.opcion1 = "valor1"
+
+    configuracion2 = Configuracion()
+    print(configuracion2.opcion1)  # Output: valor1
+
+    configuracion3 = Configuracion.obtener()
+    print(configuracion3 is configuracion1)  # Output: True
 
 """
 En este ejemplo, hemos definido la clase Configuracion como un Singleton. El método __new__ es el responsable de 
 controlar la creación de instancias. Si la instancia _instancia aún no existe, crea una nueva instancia y la almacena en 
 la variable de clase _instancia. De lo contrario, devuelve la instancia existente.
 
-El método __init__ se llama después de que se crea una nueva instancia, pero como queremos asegurarnos de que solo se 
-inicialicen los atributos una vez, utilizamos el atributo __initialized para garantizar que la inicialización solo 
-ocurra la primera vez que se crea la instancia.
+La creación de la instancia está protegida por un lock (threading.Lock) con doble verificación: si dos hilos llaman a 
+Configuracion() al mismo tiempo, solo uno construye la instancia. Los atributos se inicializan dentro de __new__ antes 
+de publicar la instancia, así que no hace falta un atributo __initialized que se revise en cada llamada. Una vez creada 
+la instancia, las llamadas posteriores la leen sin tomar el lock. El método de clase obtener() es un acceso aún más 
+ligero, que devuelve la instancia directamente sin pasar por __new__ ni __init__.
+
+El Singleton anterior es único por proceso. ConfiguracionCompartida guarda la configuración en un segmento de memoria 
+compartida (multiprocessing.shared_memory) con un contador de versión, de modo que todos los procesos que abren el 
+segmento por su nombre ven la misma configuración. El escritor incrementa la versión antes y después de escribir 
+(una versión impar indica una escritura en curso); los lectores solo decodifican los datos cuando la versión cambia, 
+sin locks ni comunicación entre procesos. Con recargar_desde_archivo() se pueden publicar nuevos valores en caliente 
+sin reiniciar los procesos.
+
+La vida del segmento pertenece al proceso que lo crea (crear=True): es el único que debe llamar a destruir(), y si 
+termina sin hacerlo su resource_tracker borra el segmento. Los procesos que lo abren por su nombre no lo registran en 
+ningún resource_tracker, así que pueden terminar en cualquier momento sin afectar a los demás; solo llaman a cerrar().
 
 Ahora, cuando creamos múltiples instancias de Configuracion, todas se refieren a la misma instancia única, lo que 
 garantiza que todas comparten y acceden a la misma configuración.
@@ -47,4 +192,90 @@ garantiza que todas comparten y acceden a la misma configuración.
 En resumen, el patrón Singleton es útil cuando necesitas asegurarte de que una clase tenga solo una instancia y que esta 
 instancia sea accesible desde cualquier parte del código. Puede ser utilizado en situaciones donde necesitas compartir 
 recursos globales o datos de configuración en una única instancia en todo el programa.
-"""
\ No newline at end of file
+"""
+
+
+# Prueba de estrés con varios hilos: comprueba que solo se crea una instancia y mide la latencia por llamada
+def benchmark_hilos(hilos: int = 8, llamadas: int = 100_000):
+    instancia_original = Configuracion._instancia
+    Configuracion._instancia = None
+    barrera = threading.Barrier(hilos)
+    instancias = set()
+
+    def construir():
+        barrera.wait()
+        instancias.add(id(Configuracion()))
+
+    def ejecutar_en_hilos(objetivo) -> float:
+        trabajadores = [threading.Thread(target=objetivo) for _ in range(hilos)]
+        inicio = time.perf_counter()
+        for trabajador in trabajadores:
+            trabajador.start()
+        for trabajador in trabajadores:
+            trabajador.join()
+        return time.perf_counter() - inicio
+
+    ejecutar_en_hilos(construir)
+    print(f"Instancias creadas por {hilos} hilos: {len(instancias)}")
+
+    def llamar_constructor():
+        for _ in range(llamadas):
+            Configuracion()
+
+    def llamar_obtener():
+        obtener = Configuracion.obtener
+        for _ in range(llamadas):
+            obtener()
+
+    for acceso, objetivo in (("Configuracion()", llamar_constructor), ("Configuracion.obtener()", llamar_obtener)):
+        duracion = ejecutar_en_hilos(objetivo)
+        print(f"{acceso}: {duracion / (hilos * llamadas) * 1e9:.0f} ns/llamada")
+    Configuracion._instancia = instancia_original
+
+
+def _leer_en_otro_proceso(nombre: str, cola):
+    configuracion = ConfiguracionCompartida(nombre)
+    cola.put((configuracion.opcion1, configuracion.opcion2))
+    configuracion.cerrar()
+
+
+# Latencia de lectura de ConfiguracionCompartida frente al acceso a un atributo normal
+def benchmark_memoria_compartida(lecturas: int = 1_000_000):
+    import multiprocessing
+    import tempfile
+
+    nombre = f"configuracion_{os.getpid()}"
+    compartida = ConfiguracionCompartida(nombre, crear=True)
+    try:
+        with tempfile.NamedTemporaryFile("w", suffix=".json", delete=False) as archivo:
+            json.dump({"opcion1": "valor1", "opcion2": "valor2"}, archivo)
+        compartida.recargar_desde_archivo(archivo.name)
+        os.unlink(archivo.name)
+
+        cola = multiprocessing.Queue()
+        proceso = multiprocessing.Process(target=_leer_en_otro_proceso, args=(nombre, cola))
+        proceso.start()
+        print(f"Valores leídos por otro proceso: {cola.get()} (versión {compartida.version})")
+        proceso.join()
+
+        configuracion = Configuracion.obtener()
+        inicio = time.perf_counter()
+        for _ in range(lecturas):
+            configuracion.opcion1
+        tiempo_atributo = time.perf_counter() - inicio
+
+        inicio = time.perf_counter()
+        for _ in range(lecturas):
+            compartida.opcion1
+        tiempo_compartida = time.perf_counter() - inicio
+
+        print(f"Configuracion().opcion1:        {tiempo_atributo / lecturas * 1e9:.0f} ns/lectura")
+        print(f"ConfiguracionCompartida.opcion1: {tiempo_compartida / lecturas * 1e9:.0f} ns/lectura")
+    finally:
+        compartida.destruir()
+
+
+if __name__ == "__main__":
+    demo()
+    benchmark_hilos()
+    benchmark_memoria_compartida()
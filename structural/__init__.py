@@ -0,0 +1,84 @@
+"""
+Patrones de diseño estructurales
+
+Importar el paquete no ejecuta ningún ejemplo ni importa sus módulos: cada clase se carga la primera vez que se accede 
+a ella (por ejemplo, structural.OldPrinter). Los ejemplos se ejecutan con: python -m structural [patron ...]
+"""
+
+from _paquetes import atributos_perezosos
+
+# Nombre público -> módulo del paquete que lo define. Componente existe en structural_composite y en 
+# structural_decorator, así que no se exporta aquí: se importa desde su módulo
+_ATRIBUTOS = {
+    # structural_adapter
+    "OldPrinter": "structural_adapter",
+    "NewPrinter": "structural_adapter",
+    "PrinterAdapter": "structural_adapter",
+    "BufferedPrinterAdapter": "structural_adapter",
+    "make_adapter_class": "structural_adapter",
+    "GeneratedPrinterAdapter": "structural_adapter",
+    "use_printer": "structural_adapter",
+
+    # structural_bridge
+    "Color": "structural_bridge",
+    "RenderCache": "structural_bridge",
+    "render_cache": "structural_bridge",
+    "Shape": "structural_bridge",
+    "RedColor": "structural_bridge",
+    "GreenColor": "structural_bridge",
+    "Circle": "structural_bridge",
+    "Square": "structural_bridge",
+    "ShapeArray": "structural_bridge",
+
+    # structural_composite
+    "Forma": "structural_composite",
+    "GrupoFormas": "structural_composite",
+    "ArbolCompacto": "structural_composite",
+    "FormaCompacta": "structural_composite",
+    "GrupoCompacto": "structural_composite",
+    "IndiceNombres": "structural_composite",
+
+    # structural_decorator
+    "ComponenteConcreto": "structural_decorator",
+    "Decorador": "structural_decorator",
+    "DecoradorA": "structural_decorator",
+    "DecoradorB": "structural_decorator",
+    "DecoradorCache": "structural_decorator",
+    "DecoradorMetricas": "structural_decorator",
+    "CadenaFusionada": "structural_decorator",
+
+    # structural_facade
+    "VerificadorEnergia": "structural_facade",
+    "CargadorSistemaOperativo": "structural_facade",
+    "DetenerServicios": "structural_facade",
+    "VerificadorEnergiaMemoizado": "structural_facade",
+    "subsistema_compartido": "structural_facade",
+    "FachadaComputadora": "structural_facade",
+    "Paso": "structural_facade",
+    "en_hilo": "structural_facade",
+    "ordenar_pasos": "structural_facade",
+    "ejecutar_pasos": "structural_facade",
+    "FachadaComputadoraAsync": "structural_facade",
+    "LATENCIAS_SIMULADAS": "structural_facade",
+    "SubsistemaSimulado": "structural_facade",
+    "VerificadorEnergiaSimulado": "structural_facade",
+    "Tramo": "structural_facade",
+    "RecolectorMemoria": "structural_facade",
+    "Trazador": "structural_facade",
+    "trazador": "structural_facade",
+    "reporte_tramos": "structural_facade",
+    "tramos_a_json": "structural_facade",
+    "perfil_encendido": "structural_facade",
+
+    # structural_proxy
+    "Imagen": "structural_proxy",
+    "ImagenReal": "structural_proxy",
+    "CacheImagenes": "structural_proxy",
+    "cache_imagenes": "structural_proxy",
+    "ProxyImagen": "structural_proxy",
+}
+
+__all__ = list(_ATRIBUTOS)
+
+
+__getattr__, __dir__ = atributos_perezosos(globals(), _ATRIBUTOS)
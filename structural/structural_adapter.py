@@ -12,16 +12,31 @@ clase NewPrinter en su lugar. Aquí es donde el patrón Adapter entra en juego.
 
 """
 
+import sys
+import time
+
 # Clase OldPrinter con una interfaz antigua
 class OldPrinter:
     def print_old(self, message):
         print(f"Mensaje antiguo: {message}")
 
+    def print_many(self, messages):
+        # Todos los mensajes se escriben con una sola llamada a write
+        lines = "".join(f"Mensaje antiguo: {message}\n" for message in messages)
+        if lines:
+            sys.stdout.write(lines)
+
 # Clase NewPrinter con una interfaz nueva
 class NewPrinter:
     def print_new(self, message):
         print(f"Mensaje nuevo: {message}")
 
+    def print_many(self, messages):
+        # Todos los mensajes se escriben con una sola llamada a write
+        lines = "".join(f"Mensaje nuevo: {message}\n" for message in messages)
+        if lines:
+            sys.stdout.write(lines)
+
 # Clase Adapter que convierte la interfaz de OldPrinter en la de NewPrinter
 class PrinterAdapter:
     def __init__(self, new_printer):
@@ -31,15 +46,167 @@ class PrinterAdapter:
         # Llama al método de la clase NewPrinter
         self.new_printer.print_new(message)
 
+    def print_many(self, messages):
+        self.new_printer.print_many(messages)
+
+# Adapter con buffer: acumula los mensajes y los entrega en bloque por tamaño o por tiempo
+class BufferedPrinterAdapter(PrinterAdapter):
+    def __init__(self, new_printer, max_messages: int = 1000, max_delay: float = 0.5):
+        super().__init__(new_printer)
+        self.max_messages = max_messages
+        self.max_delay = max_delay
+        self._buffer = []
+        self._first_message_time = None
+
+    def print_old(self, message):
+        if not self._buffer:
+            self._first_message_time = time.monotonic()
+        self._buffer.append(message)
+        # El tiempo solo se revisa al recibir mensajes; flush() (o salir del bloque with) entrega lo pendiente
+        if len(self._buffer) >= self.max_messages or time.monotonic() - self._first_message_time >= self.max_delay:
+            self.flush()
+
+    def print_many(self, messages):
+        self.flush()
+        super().print_many(messages)
+
+    def flush(self):
+        if self._buffer:
+            messages, self._buffer = self._buffer, []
+            self.new_printer.print_many(messages)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.flush()
+
+# Fábrica de adaptadores: genera una clase que, al construirse, enlaza directamente los métodos del objeto adaptado
+def make_adapter_class(method_map: dict, name: str = "GeneratedAdapter"):
+    # method_map: nombre del método en la interfaz esperada -> nombre del método en el objeto adaptado
+    method_map = dict(method_map)
+
+    def __init__(self, adaptee):
+        self.adaptee = adaptee
+        # Se guardan los métodos ligados del objeto adaptado: llamar al adaptador es llamar al adaptado, sin un frame
+        # intermedio. Si el adaptado es otro adaptador generado, se enlaza el método final y la cadena desaparece
+        for target_name, source_name in method_map.items():
+            setattr(self, target_name, getattr(adaptee, source_name))
+
+    return type(name, (), {"__init__": __init__, "method_map": method_map})
+
+# Adaptador generado equivalente a PrinterAdapter
+GeneratedPrinterAdapter = make_adapter_class(
+    {"print_old": "print_new", "print_many": "print_many"}, "GeneratedPrinterAdapter"
+)
+
 # Función para usar el adaptador
 def use_printer(printer):
     printer.print_old("Hola, mundo!")
 
-# Crear una instancia de NewPrinter
-new_printer = NewPrinter()
+def demo():
+    # Crear una instancia de NewPrinter
+    new_printer = NewPrinter()
+
+    # Crear una instancia del adaptador, pasando NewPrinter como parámetro
+    adapter = PrinterAdapter(new_printer)
+
+    # Usar la función que espera una instancia de OldPrinter
+    use_printer(adapter)
+
+    # Enviar varios mensajes en bloque
+    adapter.print_many(["Primero", "Segundo"])
+
+    # Usar un adaptador generado a partir de la correspondencia entre métodos
+    use_printer(GeneratedPrinterAdapter(new_printer))
+
+    # Acumular mensajes en un buffer y entregarlos juntos al salir del bloque
+    with BufferedPrinterAdapter(new_printer, max_messages=100) as buffered_adapter:
+        use_printer(buffered_adapter)
+        use_printer(buffered_adapter)
+
+
+"""
+El adaptador también ofrece print_many(), que entrega varios mensajes con una sola escritura. BufferedPrinterAdapter 
+va un paso más allá: acumula los mensajes que recibe por print_old() en un buffer acotado y los entrega juntos cuando se 
+llena (max_messages) o cuando el mensaje más antiguo lleva esperando más de max_delay segundos. Al usarlo con with, o 
+al llamar a flush(), se entregan los mensajes pendientes.
+
+Cada llamada a través de PrinterAdapter añade un frame de Python y la búsqueda de self.new_printer. La función 
+make_adapter_class() genera adaptadores a partir de una correspondencia entre nombres de métodos (por ejemplo, 
+{"print_old": "print_new"}): al construir el adaptador se guardan los métodos ligados del objeto adaptado, así que 
+llamar al adaptador cuesta lo mismo que llamar al adaptado, aunque se apilen varios adaptadores. A cambio, si después 
+se reemplaza un método del objeto adaptado, el adaptador generado sigue usando el método que había al construirlo.
+"""
+
+
+# Mensajes por segundo: print_old() uno a uno, print_many() y BufferedPrinterAdapter
+def benchmark_entrega(mensajes: int = 200_000):
+    import contextlib
+    import os
+
+    new_printer = NewPrinter()
+    textos = [f"mensaje {i}" for i in range(mensajes)]
+    resultados = {}
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        adapter = PrinterAdapter(new_printer)
+        inicio = time.perf_counter()
+        for texto in textos:
+            adapter.print_old(texto)
+        resultados["print_old()"] = time.perf_counter() - inicio
+
+        inicio = time.perf_counter()
+        adapter.print_many(textos)
+        resultados["print_many()"] = time.perf_counter() - inicio
+
+        inicio = time.perf_counter()
+        with BufferedPrinterAdapter(new_printer) as buffered_adapter:
+            for texto in textos:
+                buffered_adapter.print_old(texto)
+        resultados["BufferedPrinterAdapter"] = time.perf_counter() - inicio
+
+    for nombre, duracion in resultados.items():
+        print(f"{nombre:<24} {mensajes / duracion:>12,.0f} mensajes/s")
+
+
+# Costo de despacho: llamada directa, PrinterAdapter escrito a mano y adaptador generado, con varias capas apiladas
+def benchmark_despacho(llamadas: int = 1_000_000):
+    class Sink:
+        def print_new(self, message):
+            pass
+
+    # Capa escrita a mano que solo reenvía la llamada, para poder apilar PrinterAdapter
+    class ManualLayer:
+        def __init__(self, target):
+            self.target = target
+
+        def print_new(self, message):
+            self.target.print_new(message)
+
+    GeneratedLayer = make_adapter_class({"print_new": "print_new"}, "GeneratedLayer")
+    OldToNewAdapter = make_adapter_class({"print_old": "print_new"}, "OldToNewAdapter")
+
+    def measure(call) -> float:
+        inicio = time.perf_counter()
+        for _ in range(llamadas):
+            call("mensaje")
+        return (time.perf_counter() - inicio) / llamadas * 1e9
+
+    sink = Sink()
+    print(f"Llamada directa: {measure(sink.print_new):6.1f} ns/llamada")
+    for depth in (1, 2, 3, 4):
+        manual = sink
+        generated = sink
+        for _ in range(depth - 1):
+            manual = ManualLayer(manual)
+            generated = GeneratedLayer(generated)
+        manual = PrinterAdapter(manual)
+        generated = OldToNewAdapter(generated)
+        print(f"Profundidad {depth}: PrinterAdapter {measure(manual.print_old):6.1f} ns/llamada, "
+              f"generado {measure(generated.print_old):6.1f} ns/llamada")
 
-# Crear una instancia del adaptador, pasando NewPrinter como parámetro
-adapter = PrinterAdapter(new_printer)
 
-# Usar la función que espera una instancia de OldPrinter
-use_printer(adapter)
+if __name__ == "__main__":
+    demo()
+    benchmark_entrega()
+    benchmark_despacho()
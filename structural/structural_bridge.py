@@ -29,18 +29,79 @@ evitar una combinación exponencial de clases concretas. Al separar las jerarqu
 "Implementación", el patrón Bridge promueve un diseño más flexible y fácil de mantener.
 """
 
+import random
+import time
+from array import array
+
 
 class Color:
+    # Instancias compartidas (flyweight), una por clase de color
+    _compartidos = {}
+
     def fill(self) -> str:
         pass
 
+    @classmethod
+    def compartido(cls) -> "Color":
+        color = Color._compartidos.get(cls)
+        if color is None:
+            color = Color._compartidos[cls] = cls()
+        return color
+
+# Caché de dibujos: como las implementaciones de Color no tienen estado, el resultado de draw() solo depende de la
+# clase de la forma y del color
+class RenderCache:
+    def __init__(self):
+        self._dibujos = {}
+        self.aciertos = 0
+        self.fallos = 0
+
+    def obtener(self, shape: "Shape") -> str:
+        # La clave es la clase del color actual, no la instancia: dos RedColor() distintos comparten la entrada, y la caché
+        # no retiene instancias de color. Si se cambia shape.color, la siguiente llamada usa la entrada del nuevo color
+        clave = (shape.__class__, shape.color.__class__)
+        dibujo = self._dibujos.get(clave)
+        if dibujo is None:
+            self.fallos += 1
+            dibujo = self._dibujos[clave] = shape.draw()
+        else:
+            self.aciertos += 1
+        return dibujo
+
+    def invalidar(self):
+        self._dibujos.clear()
+
+    @property
+    def tasa_aciertos(self) -> float:
+        total = self.aciertos + self.fallos
+        return self.aciertos / total if total else 0.0
+
+render_cache = RenderCache()
+
 class Shape:
     def __init__(self, color: Color) -> None:
         self.color = color
 
+    @property
+    def color(self) -> Color:
+        return self._color
+
+    @color.setter
+    def color(self, color: Color):
+        self._color = color
+        # El dibujo guardado corresponde al color anterior
+        self._dibujo = None
+
     def draw(self) -> str:
         pass
 
+    def render(self) -> str:
+        # Igual que draw(), pero guarda el resultado en la forma y lo comparte con otras formas de la misma clase y color
+        dibujo = self._dibujo
+        if dibujo is None:
+            dibujo = self._dibujo = render_cache.obtener(self)
+        return dibujo
+
 class RedColor(Color):
     def fill(self) -> str:
         return 'rojo'
@@ -59,12 +120,137 @@ class Square(Shape):
     def draw(self) -> str:
         return f'dibuja un cuadrado de color {self.color.fill()}'
 
-red = RedColor()
-green = GreenColor()
+# Escena en columnas: cada fila guarda el índice de su clase de forma y de su clase de color en registros compartidos
+class ShapeArray:
+    def __init__(self, shape_classes=(Circle, Square), color_classes=(RedColor, GreenColor)):
+        # Los índices se guardan como enteros de un byte, así que cada registro admite hasta 256 clases
+        if len(shape_classes) > 256 or len(color_classes) > 256:
+            raise ValueError("ShapeArray admite como máximo 256 clases de forma y 256 clases de color")
+        self.shape_classes = list(shape_classes)
+        self.color_classes = list(color_classes)
+        self._shape_indices = {shape_class: i for i, shape_class in enumerate(self.shape_classes)}
+        self._color_indices = {color_class: i for i, color_class in enumerate(self.color_classes)}
+        self._kinds = array("B")
+        self._colors = array("B")
+
+    def append(self, shape: Shape):
+        self._kinds.append(self._shape_indices[shape.__class__])
+        self._colors.append(self._color_indices[shape.color.__class__])
+
+    def extend(self, shapes):
+        for shape in shapes:
+            self.append(shape)
+
+    def __len__(self) -> int:
+        return len(self._kinds)
+
+    def __getitem__(self, index: int) -> Shape:
+        # Reconstruye la forma de una fila, con la instancia compartida de su color
+        return self.shape_classes[self._kinds[index]](self.color_classes[self._colors[index]].compartido())
+
+    def draw_all(self) -> list:
+        # draw() se llama una sola vez por cada combinación (forma, color); cada fila toma el dibujo de su combinación
+        total_colors = len(self.color_classes)
+        dibujos = [
+            shape_class(color_class.compartido()).draw()
+            for shape_class in self.shape_classes
+            for color_class in self.color_classes
+        ]
+        return [dibujos[kind * total_colors + color] for kind, color in zip(self._kinds, self._colors)]
+
+def demo():
+    red = RedColor.compartido()
+    green = GreenColor.compartido()
+
+    red_circle = Circle(red)
+    green_square = Square(green)
+
+
+    print(red_circle.draw())
+    print(green_square.draw())
+
+    # render() reutiliza el dibujo de cualquier otro círculo rojo
+    print(Circle(red).render())  # Output: dibuja un circulo de color rojo
+    print(red_circle.render())  # Output: dibuja un circulo de color rojo
+    red_circle.color = green
+    print(red_circle.render())  # Output: dibuja un circulo de color verde
+
+    # Guardar la escena en columnas y dibujarla completa de una vez
+    scene = ShapeArray()
+    scene.extend([Circle(red), Square(green), Square(red)])
+    print(scene.draw_all())
+    # Output: ['dibuja un circulo de color rojo', 'dibuja un cuadrado de color verde',
+    #          'dibuja un cuadrado de color rojo']
+
+
+"""
+Las implementaciones de Color no tienen estado, así que Color.compartido() devuelve una única instancia por clase 
+(flyweight) que todas las formas pueden compartir. Por la misma razón, el resultado de draw() solo depende de la clase de 
+la forma y de su color: render() consulta una caché (RenderCache) con esa clave, solo llama a draw() la primera vez y 
+guarda el resultado en la propia forma. Como color es una propiedad, cambiar shape.color en tiempo de ejecución borra 
+el dibujo guardado, y el siguiente render() usa la entrada del nuevo color. Los contadores aciertos, fallos y 
+tasa_aciertos muestran cuánto se reutiliza la caché compartida.
+
+Para escenas con millones de formas, ShapeArray guarda cada forma como dos enteros pequeños (array "B"): el índice de 
+su clase de forma y el de su clase de color dentro de dos registros. draw_all() llama a draw() una sola vez por cada 
+combinación de forma y color y arma el resultado de todas las filas a partir de esos dibujos, con el mismo resultado que 
+llamar a draw() en cada forma.
+"""
+
+
+# Escena con reutilización sesgada: unas pocas combinaciones (forma, color) concentran la mayoría de los dibujos
+def benchmark_render(dibujos: int = 1_000_000, colores: int = 20):
+    clases_color = [type(f"Color{i}", (Color,), {"fill": lambda self, i=i: f"color {i}"}) for i in range(colores)]
+    pesos = [1 / (i + 1) for i in range(colores)]
+    escena = [
+        random.choice((Circle, Square))(random.choices(clases_color, pesos)[0].compartido())
+        for _ in range(10_000)
+    ]
+    indices = random.choices(range(len(escena)), k=dibujos)
+
+    inicio = time.perf_counter()
+    for indice in indices:
+        escena[indice].draw()
+    tiempo_draw = time.perf_counter() - inicio
+
+    render_cache.invalidar()
+    render_cache.aciertos = render_cache.fallos = 0
+    inicio = time.perf_counter()
+    for indice in indices:
+        escena[indice].render()
+    tiempo_render = time.perf_counter() - inicio
+
+    # Cambiar el color de algunas formas no debe dejar dibujos obsoletos
+    for shape in escena[:100]:
+        shape.color = clases_color[-1].compartido()
+    assert all(shape.render() == shape.draw() for shape in escena)
+
+    print(f"draw():   {dibujos / tiempo_draw:>12,.0f} dibujos/s")
+    print(f"render(): {dibujos / tiempo_render:>12,.0f} dibujos/s ({tiempo_draw / tiempo_render:.1f}x), "
+          f"tasa de aciertos {render_cache.tasa_aciertos:.2%}")
+
+
+# ShapeArray.draw_all() frente a un bucle de Python que llama a draw() en cada forma
+def benchmark_shape_array(filas: int = 1_000_000):
+    colores = [RedColor.compartido(), GreenColor.compartido()]
+    shapes = [random.choice((Circle, Square))(random.choice(colores)) for _ in range(filas)]
+    scene = ShapeArray()
+    scene.extend(shapes)
+
+    inicio = time.perf_counter()
+    dibujos_bucle = [shape.draw() for shape in shapes]
+    tiempo_bucle = time.perf_counter() - inicio
+
+    inicio = time.perf_counter()
+    dibujos_array = scene.draw_all()
+    tiempo_array = time.perf_counter() - inicio
 
-red_circle = Circle(red)
-green_square = Square(green)
+    assert dibujos_array == dibujos_bucle
+    print(f"Bucle sobre Shape:      {tiempo_bucle * 1000:8.1f} ms")
+    print(f"ShapeArray.draw_all():  {tiempo_array * 1000:8.1f} ms ({tiempo_bucle / tiempo_array:.1f}x)")
 
 
-print(red_circle.draw())
-print(green_square.draw())
+if __name__ == "__main__":
+    demo()
+    benchmark_render()
+    benchmark_shape_array()
@@ -11,32 +11,642 @@ de formas). Quieres poder trabajar con una forma individual o con un grupo de fo
 aplicando operaciones de forma consistente.
 """
 
+import io
+import os
+import random
+import sys
+import time
+from array import array
+
 # Componente base de la jerarquía
 class Componente:
     def dibujar(self):
         pass
 
+# Marca como pendientes los fragmentos guardados de los grupos indicados y de todos los grupos que los contienen
+def _invalidar(grupos):
+    pendientes = list(grupos)
+    while pendientes:
+        grupo = pendientes.pop()
+        # Si un grupo ya estaba pendiente, sus ancestros también lo están: no hace falta seguir subiendo
+        if grupo._fragmentos is not None:
+            grupo._fragmentos = None
+            grupo._dibujo = None
+            pendientes.extend(grupo._padres)
+
 # Clase Leaf (Hoja): Representa objetos individuales (formas)
 class Forma(Componente):
     def __init__(self, nombre):
+        self._padres = []
         self.nombre = nombre
 
+    @property
+    def nombre(self):
+        return self._nombre
+
+    @nombre.setter
+    def nombre(self, nombre):
+        # Índices de los grupos que contienen la forma (uno por árbol indexado, aunque la forma esté en varios grupos)
+        indices = {id(grupo._indice): grupo._indice for grupo in self._padres if grupo._indice is not None}
+        for indice in indices.values():
+            indice.quitar(self)
+        self._nombre = nombre
+        for indice in indices.values():
+            indice.agregar(self)
+        _invalidar(self._padres)
+
     def dibujar(self):
         return f"Dibujando {self.nombre}"
 
+    def __getstate__(self):
+        # Al enviar una forma a otro proceso no se envían sus grupos padre (que arrastrarían todo el árbol)
+        estado = self.__dict__.copy()
+        estado["_padres"] = []
+        return estado
+
 # Clase Composite (Compuesto): Representa un grupo de objetos (conjunto de formas)
 class GrupoFormas(Componente):
     def __init__(self):
         self.formas = []
+        self._padres = []
+        # Dibujo del grupo en fragmentos: cadenas ya dibujadas intercaladas con los subgrupos (None si está pendiente)
+        self._fragmentos = None
+        # Dibujo completo, guardado solo en los grupos en los que se llamó a dibujar()
+        self._dibujo = None
+        # Nodos (grupos y formas) que se volvieron a dibujar en el último dibujo
+        self.recalculados = 0
+        # Índice de nombres compartido por todos los grupos bajo la misma raíz (None si no está activado)
+        self._indice = None
 
     def agregar(self, forma):
         self.formas.append(forma)
+        if hasattr(forma, "_padres"):
+            forma._padres.append(self)
+        if self._indice is not None:
+            self._indice.registrar(forma)
+        self._fragmentos = self._dibujo = None
+        _invalidar(self._padres)
+
+    def eliminar(self, forma):
+        self.formas.remove(forma)
+        if hasattr(forma, "_padres"):
+            forma._padres.remove(self)
+        if self._indice is not None:
+            self._indice.retirar(forma)
+        self._fragmentos = self._dibujo = None
+        _invalidar(self._padres)
+
+    def activar_indice(self) -> "IndiceNombres":
+        # Indexa las formas del árbol por nombre; el índice se mantiene al agregar, eliminar y renombrar. Si el grupo ya
+        # está dentro de un árbol indexado se devuelve ese índice, que es el que comparten todos sus grupos
+        if self._indice is None:
+            IndiceNombres(self)
+        return self._indice
+
+    def buscar(self, nombre):
+        # Devuelve una forma con ese nombre dentro del grupo, o None. Con el índice activado no se recorre el árbol:
+        # solo se sube desde cada candidata hasta comprobar que está dentro de este grupo
+        if self._indice is not None:
+            for forma in self._indice.buscar(nombre):
+                if forma.nombre == nombre and self.ruta(forma) is not None:
+                    return forma
+            return None
+        pila = [self]
+        while pila:
+            componente = pila.pop()
+            if isinstance(componente, GrupoFormas):
+                pila.extend(reversed(componente.formas))
+            elif isinstance(componente, Forma) and componente.nombre == nombre:
+                return componente
+        return None
+
+    def ruta(self, componente):
+        # Grupos desde este grupo hasta el padre del componente, subiendo por los enlaces a los padres (si un componente
+        # está en varios grupos se sigue el primero). None si el componente no está dentro de este grupo
+        ruta = []
+        padres = componente._padres
+        while padres:
+            grupo = padres[0]
+            ruta.append(grupo)
+            if grupo is self:
+                ruta.reverse()
+                return ruta
+            padres = grupo._padres
+        return None
+
+    def dibujar(self):
+        if self._dibujo is None:
+            self._dibujo = "".join(self._partes())
+        return self._dibujo
+
+    def _actualizar_fragmentos(self):
+        # Recorrido en postorden con una pila explícita: solo se vuelven a dibujar los grupos pendientes; los subgrupos
+        # que no cambiaron se reutilizan tal como están
+        recalculados = 0
+        pila = [(self, False)]
+        while pila:
+            grupo, hijos_listos = pila.pop()
+            if grupo._fragmentos is not None:
+                continue
+            if not hijos_listos:
+                pila.append((grupo, True))
+                pila.extend(
+                    (forma, False) for forma in grupo.formas
+                    if isinstance(forma, GrupoFormas) and forma._fragmentos is None
+                )
+                continue
+            fragmentos = []
+            lineas = ["Grupo de formas:\n"]
+            for forma in grupo.formas:
+                if isinstance(forma, GrupoFormas):
+                    fragmentos.append("".join(lineas))
+                    fragmentos.append(forma)
+                    # El salto de línea que sigue a cada hijo
+                    lineas = ["\n"]
+                else:
+                    lineas.append(forma.dibujar())
+                    lineas.append("\n")
+                    recalculados += 1
+            fragmentos.append("".join(lineas))
+            grupo._fragmentos = fragmentos
+            recalculados += 1
+        self.recalculados = recalculados
+
+    def _partes(self):
+        # Recorrido con una pila explícita de iteradores en lugar de recursión: no hay límite de profundidad y cada
+        # fragmento se produce una sola vez, sin concatenaciones repetidas
+        self._actualizar_fragmentos()
+        return self._partes_guardadas()
+
+    def _partes_guardadas(self):
+        # Recorre los fragmentos ya guardados; si el grupo los tiene, también los tienen todos sus subgrupos
+        pila = [iter(self._fragmentos)]
+        while pila:
+            for fragmento in pila[-1]:
+                if isinstance(fragmento, GrupoFormas):
+                    pila.append(iter(fragmento._fragmentos))
+                    break
+                yield fragmento
+            else:
+                pila.pop()
+
+    def _partes_en_flujo(self):
+        # Como _partes(), pero sin guardar fragmentos: los grupos pendientes se dibujan a medida que se recorren y los
+        # que ya tienen fragmentos guardados los reutilizan. Así el dibujo nunca está completo en memoria
+        if self._fragmentos is not None:
+            yield from self._partes_guardadas()
+            return
+        yield "Grupo de formas:\n"
+        pila = [iter(self.formas)]
+        while pila:
+            for forma in pila[-1]:
+                if isinstance(forma, GrupoFormas):
+                    if forma._fragmentos is not None:
+                        yield from forma._partes_guardadas()
+                        yield "\n"
+                        continue
+                    yield "Grupo de formas:\n"
+                    pila.append(iter(forma.formas))
+                    break
+                yield forma.dibujar()
+                yield "\n"
+            else:
+                # Grupo terminado: su padre agrega el salto de línea que sigue a cada hijo
+                pila.pop()
+                if pila:
+                    yield "\n"
+
+    def iterar_dibujo(self, tamano_bloque: int = 1000):
+        # Genera el dibujo en bloques de texto, cada uno formado por hasta tamano_bloque partes
+        bloque = []
+        for parte in self._partes_en_flujo():
+            bloque.append(parte)
+            if len(bloque) >= tamano_bloque:
+                yield "".join(bloque)
+                bloque = []
+        if bloque:
+            yield "".join(bloque)
+
+    def escribir_dibujo(self, archivo):
+        # Escribe el dibujo directamente en un archivo o en un io.StringIO, sin construirlo completo en memoria
+        archivo.writelines(self.iterar_dibujo())
+
+    def contar_nodos(self) -> int:
+        total = 0
+        pila = [self]
+        while pila:
+            componente = pila.pop()
+            total += 1
+            if isinstance(componente, GrupoFormas):
+                pila.extend(componente.formas)
+        return total
+
+    def dibujar_paralelo(self, workers: int = 4, umbral: int = 50_000, executor=None) -> str:
+        # Igual que dibujar(), pero reparte los subárboles entre varios procesos. Por debajo del umbral de nodos (o con
+        # un solo worker) el costo de enviar los subárboles supera la ganancia, así que se dibuja en serie
+        if workers <= 1 or self.contar_nodos() < umbral:
+            self.estadisticas_paralelo = None
+            return self.dibujar()
+
+        # Secuencia equivalente al dibujo del grupo: cadenas ya conocidas y subgrupos pendientes de dibujar. Se baja de
+        # nivel hasta tener varios subgrupos por worker para poder repartir el trabajo de forma equilibrada
+        secuencia, grupos = _expandir([self])
+        while 0 < grupos < workers * 4:
+            siguiente, nuevos = _expandir(secuencia)
+            if nuevos <= grupos:
+                # Bajar otro nivel no agrega subgrupos (el siguiente nivel son hojas, o el árbol es una cadena): se
+                # reparte el nivel actual
+                break
+            secuencia, grupos = siguiente, nuevos
+        if grupos < 2:
+            # Un solo subárbol no se puede repartir entre varios procesos
+            self.estadisticas_paralelo = None
+            return self.dibujar()
+        secuencia = [
+            elemento if elemento.__class__ is str or isinstance(elemento, GrupoFormas) else elemento.dibujar()
+            for elemento in secuencia
+        ]
+        subarboles = [_aplanar(elemento) for elemento in secuencia if isinstance(elemento, GrupoFormas)]
+        if not subarboles:
+            self.estadisticas_paralelo = None
+            return "".join(secuencia)
+        bloques = _repartir(subarboles, workers * 2)
+
+        # Se importan aquí para no cargarlos al importar el módulo
+        import concurrent.futures
+        import pickle
+
+        inicio = time.perf_counter()
+        paquetes = [pickle.dumps(bloque, pickle.HIGHEST_PROTOCOL) for bloque in bloques]
+        tiempo_serializacion = time.perf_counter() - inicio
+
+        inicio = time.perf_counter()
+        propio = executor is None
+        if propio:
+            executor = concurrent.futures.ProcessPoolExecutor(max_workers=workers)
+        try:
+            # map() conserva el orden de los bloques, y cada bloque conserva el orden de sus subárboles
+            resultados = iter([dibujo for dibujos in executor.map(_dibujar_bloque, paquetes) for dibujo in dibujos])
+        finally:
+            if propio:
+                executor.shutdown()
+        tiempo_procesos = time.perf_counter() - inicio
+
+        self.estadisticas_paralelo = {
+            "subarboles": len(subarboles),
+            "bloques": len(bloques),
+            "bytes_enviados": sum(len(paquete) for paquete in paquetes),
+            "tiempo_serializacion": tiempo_serializacion,
+            "tiempo_procesos": tiempo_procesos,
+        }
+        return "".join(elemento if elemento.__class__ is str else next(resultados) for elemento in secuencia)
+
+# Índice de formas por nombre de un árbol de GrupoFormas. Cada nombre guarda su forma; como los nombres pueden
+# repetirse, un nombre usado por varias formas guarda la lista de todas ellas, en el orden en que se indexaron. Así la
+# gran mayoría de las entradas no necesita una lista propia
+class IndiceNombres:
+    def __init__(self, raiz: GrupoFormas):
+        self.raiz = raiz
+        self._formas = {}
+        # Formas que están en varios grupos del árbol -> cuántas veces aparecen. Se indexan una sola vez y solo se quitan
+        # del índice cuando se retira su última aparición
+        self._repetidas = {}
+        self.registrar(raiz)
+
+    def __len__(self):
+        return sum(len(formas) if formas.__class__ is list else 1 for formas in self._formas.values())
+
+    def agregar(self, forma: Forma):
+        actual = self._formas.get(forma.nombre)
+        if actual is None:
+            self._formas[forma.nombre] = forma
+        elif actual.__class__ is list:
+            actual.append(forma)
+        else:
+            self._formas[forma.nombre] = [actual, forma]
+
+    def quitar(self, forma: Forma):
+        actual = self._formas[forma.nombre]
+        if actual.__class__ is not list:
+            del self._formas[forma.nombre]
+            return
+        actual.remove(forma)
+        if len(actual) == 1:
+            self._formas[forma.nombre] = actual[0]
+
+    def registrar(self, componente: Componente):
+        # Indexa el componente y, si es un grupo, todo su subárbol, que pasa a compartir este índice. Si el subárbol
+        # tenía su propio índice, ese índice se abandona: un árbol nunca queda repartido entre dos índices
+        pila = [componente]
+        while pila:
+            componente = pila.pop()
+            if isinstance(componente, GrupoFormas):
+                if componente._indice is self:
+                    continue
+                componente._indice = self
+                pila.extend(reversed(componente.formas))
+            elif isinstance(componente, Forma):
+                actual = self._formas.get(componente.nombre)
+                if actual is None:
+                    self._formas[componente.nombre] = componente
+                elif self._contiene(actual, componente):
+                    self._repetidas[componente] = self._repetidas.get(componente, 1) + 1
+                else:
+                    self.agregar(componente)
+
+    def retirar(self, componente: Componente):
+        pila = [componente]
+        while pila:
+            componente = pila.pop()
+            if isinstance(componente, GrupoFormas):
+                componente._indice = None
+                pila.extend(componente.formas)
+            elif isinstance(componente, Forma):
+                apariciones = self._repetidas.pop(componente, 1)
+                if apariciones > 2:
+                    self._repetidas[componente] = apariciones - 1
+                elif apariciones == 1:
+                    self.quitar(componente)
+
+    @staticmethod
+    def _contiene(actual, forma: Forma) -> bool:
+        # actual es la entrada del índice para el nombre de la forma: una forma o una lista de formas
+        return actual is forma or (actual.__class__ is list and any(candidata is forma for candidata in actual))
+
+    def buscar(self, nombre) -> list:
+        actual = self._formas.get(nombre)
+        if actual is None:
+            return []
+        return actual if actual.__class__ is list else [actual]
+
+# Reemplaza cada grupo de la secuencia por su propio dibujo en partes: encabezado, hijos y saltos de línea. Devuelve
+# también cuántos grupos quedaron en la nueva secuencia
+def _expandir(secuencia: list) -> tuple:
+    resultado = []
+    grupos = 0
+    for elemento in secuencia:
+        if isinstance(elemento, GrupoFormas):
+            resultado.append("Grupo de formas:\n")
+            for forma in elemento.formas:
+                resultado.append(forma)
+                resultado.append("\n")
+                if isinstance(forma, GrupoFormas):
+                    grupos += 1
+        else:
+            resultado.append(elemento)
+    return resultado, grupos
+
+# Representación plana de un subárbol en preorden: cada grupo es el número de hijos que tiene, cada Forma es su nombre y
+# cualquier otra hoja es el propio componente. Se puede serializar sin recursión, aunque el árbol sea muy profundo, y
+# serializar nombres es mucho más barato que serializar objetos Forma
+def _aplanar(grupo: GrupoFormas) -> list:
+    plano = []
+    pila = [grupo]
+    while pila:
+        componente = pila.pop()
+        if isinstance(componente, GrupoFormas):
+            plano.append(len(componente.formas))
+            pila.extend(reversed(componente.formas))
+        elif componente.__class__ is Forma:
+            plano.append(componente.nombre)
+        else:
+            plano.append(componente)
+    return plano
+
+# Divide los subárboles en bloques contiguos con una cantidad parecida de nodos
+def _repartir(subarboles: list, cantidad: int) -> list:
+    objetivo = sum(len(plano) for plano in subarboles) / cantidad
+    bloques = [[]]
+    acumulado = 0
+    for plano in subarboles:
+        if acumulado >= objetivo * len(bloques):
+            bloques.append([])
+        bloques[-1].append(plano)
+        acumulado += len(plano)
+    return bloques
+
+# Dibuja un subárbol a partir de su representación plana; produce lo mismo que GrupoFormas.dibujar()
+def _dibujar_plano(plano: list) -> str:
+    partes = []
+    # Hijos que le faltan a cada grupo abierto
+    pendientes = []
+    for elemento in plano:
+        if elemento.__class__ is int:
+            partes.append("Grupo de formas:\n")
+            if elemento:
+                pendientes.append(elemento)
+                continue
+        elif elemento.__class__ is str:
+            # Solo las instancias exactas de Forma llegan como nombre, así que su dibujo se arma directamente
+            partes.append(f"Dibujando {elemento}")
+        else:
+            partes.append(elemento.dibujar())
+        # El nodo terminó: su grupo agrega el salto de línea y, si era su último hijo, también termina
+        while pendientes:
+            partes.append("\n")
+            pendientes[-1] -= 1
+            if pendientes[-1]:
+                break
+            pendientes.pop()
+    return "".join(partes)
+
+# Función que ejecuta cada proceso del pool
+def _dibujar_bloque(paquete: bytes) -> list:
+    import pickle
+
+    return [_dibujar_plano(plano) for plano in pickle.loads(paquete)]
+
+# Árbol compacto: los nodos son índices y los enlaces se guardan en arreglos de enteros (padre, primer hijo, último hijo
+# y siguiente hermano). Los nombres de las hojas se guardan codificados en un único bytearray; cada hoja guarda dónde
+# empieza su nombre y cuánto mide. Los grupos tienen largo -1
+class ArbolCompacto:
+    def __init__(self):
+        self._padre = array("i")
+        self._primer_hijo = array("i")
+        self._ultimo_hijo = array("i")
+        self._siguiente = array("i")
+        self._inicio_nombre = array("q")
+        self._largo_nombre = array("i")
+        self._texto = bytearray()
+
+    def __len__(self):
+        return len(self._padre)
+
+    def _nuevo_nodo(self, padre: int, inicio: int, largo: int) -> int:
+        nodo = len(self._padre)
+        self._padre.append(-1)
+        self._primer_hijo.append(-1)
+        self._ultimo_hijo.append(-1)
+        self._siguiente.append(-1)
+        self._inicio_nombre.append(inicio)
+        self._largo_nombre.append(largo)
+        if padre != -1:
+            self.enlazar(padre, nodo)
+        return nodo
+
+    def crear_grupo(self, padre: int = -1) -> int:
+        return self._nuevo_nodo(padre, 0, -1)
+
+    def crear_forma(self, nombre: str, padre: int = -1) -> int:
+        inicio, largo = self._guardar_nombre(nombre)
+        return self._nuevo_nodo(padre, inicio, largo)
+
+    def _guardar_nombre(self, nombre: str) -> tuple:
+        codificado = nombre.encode()
+        inicio = len(self._texto)
+        self._texto += codificado
+        return inicio, len(codificado)
+
+    def es_grupo(self, nodo: int) -> bool:
+        return self._largo_nombre[nodo] == -1
+
+    def nombre(self, nodo: int) -> str:
+        inicio = self._inicio_nombre[nodo]
+        return self._texto[inicio:inicio + self._largo_nombre[nodo]].decode()
+
+    def renombrar(self, nodo: int, nombre: str):
+        # El nombre anterior queda sin uso dentro del texto: renombrar muchas veces hace crecer el bytearray
+        self._inicio_nombre[nodo], self._largo_nombre[nodo] = self._guardar_nombre(nombre)
+
+    def hijos(self, nodo: int):
+        hijo = self._primer_hijo[nodo]
+        while hijo != -1:
+            yield hijo
+            hijo = self._siguiente[hijo]
+
+    def enlazar(self, padre: int, nodo: int):
+        if not self.es_grupo(padre):
+            raise ValueError("Solo los grupos pueden tener hijos")
+        if self._padre[nodo] != -1:
+            raise ValueError("El nodo ya pertenece a un grupo")
+        # Un grupo no puede quedar dentro de sí mismo: se sube desde el padre buscando el nodo
+        ancestro = padre
+        while ancestro != -1:
+            if ancestro == nodo:
+                raise ValueError("Un grupo no puede agregarse dentro de sí mismo ni de sus descendientes")
+            ancestro = self._padre[ancestro]
+        self._padre[nodo] = padre
+        if self._ultimo_hijo[padre] == -1:
+            self._primer_hijo[padre] = nodo
+        else:
+            self._siguiente[self._ultimo_hijo[padre]] = nodo
+        self._ultimo_hijo[padre] = nodo
+
+    def desenlazar(self, nodo: int):
+        # El nodo (y su subárbol) sigue existiendo y se puede volver a enlazar en otro grupo
+        padre = self._padre[nodo]
+        if padre == -1:
+            raise ValueError("El nodo no pertenece a ningún grupo")
+        anterior = -1
+        hijo = self._primer_hijo[padre]
+        while hijo != nodo:
+            anterior, hijo = hijo, self._siguiente[hijo]
+        if anterior == -1:
+            self._primer_hijo[padre] = self._siguiente[nodo]
+        else:
+            self._siguiente[anterior] = self._siguiente[nodo]
+        if self._ultimo_hijo[padre] == nodo:
+            self._ultimo_hijo[padre] = anterior
+        self._padre[nodo] = self._siguiente[nodo] = -1
+
+    def dibujar(self, nodo: int) -> str:
+        # Mismo resultado que GrupoFormas.dibujar(), recorriendo los arreglos con una pila de grupos abiertos
+        if not self.es_grupo(nodo):
+            return f"Dibujando {self.nombre(nodo)}"
+        primer_hijo, siguiente, largos, inicios, texto = (
+            self._primer_hijo, self._siguiente, self._largo_nombre, self._inicio_nombre, self._texto
+        )
+        # Las partes se arman en bytes y se decodifican una sola vez al final
+        grupo, dibujando, salto = b"Grupo de formas:\n", b"Dibujando ", b"\n"
+        partes = [grupo]
+        agregar = partes.append
+        pila = []
+        hijo = primer_hijo[nodo]
+        while True:
+            while hijo != -1:
+                largo = largos[hijo]
+                if largo == -1:
+                    agregar(grupo)
+                    pila.append(hijo)
+                    hijo = primer_hijo[hijo]
+                    continue
+                inicio = inicios[hijo]
+                agregar(dibujando)
+                agregar(texto[inicio:inicio + largo])
+                agregar(salto)
+                hijo = siguiente[hijo]
+            if not pila:
+                return b"".join(partes).decode()
+            # El grupo terminó: su padre agrega el salto de línea y sigue con el siguiente hermano
+            agregar(salto)
+            hijo = siguiente[pila.pop()]
+
+    def vista(self, nodo: int) -> Componente:
+        return GrupoCompacto(self, nodo) if self.es_grupo(nodo) else FormaCompacta(self, nodo)
+
+    def copiar(self, componente: Componente, padre: int = -1) -> int:
+        # Copia un árbol de grupos y formas (sin recursión) y devuelve el nodo de su raíz
+        raiz = len(self)
+        pila = [(componente, padre)]
+        while pila:
+            componente, padre = pila.pop()
+            if isinstance(componente, (GrupoFormas, GrupoCompacto)):
+                nodo = self.crear_grupo(padre)
+                pila.extend((forma, nodo) for forma in reversed(componente.formas))
+            elif isinstance(componente, (Forma, FormaCompacta)):
+                self.crear_forma(componente.nombre, padre)
+            else:
+                raise TypeError(f"El árbol compacto solo guarda formas y grupos, no {type(componente).__name__}")
+        return raiz
+
+    @classmethod
+    def desde_componente(cls, componente: Componente) -> "ArbolCompacto":
+        # La raíz del árbol copiado queda en el nodo 0
+        arbol = cls()
+        arbol.copiar(componente)
+        return arbol
+
+# Vistas de un nodo del árbol compacto con la misma interfaz que Forma y GrupoFormas; no guardan datos propios, así
+# que se pueden crear y descartar en cualquier momento
+class _VistaCompacta(Componente):
+    def __init__(self, arbol: ArbolCompacto, nodo: int):
+        self.arbol = arbol
+        self.nodo = nodo
 
     def dibujar(self):
-        resultado = "Grupo de formas:\n"
-        for forma in self.formas:
-            resultado += forma.dibujar() + "\n"
-        return resultado
+        return self.arbol.dibujar(self.nodo)
+
+    def __eq__(self, otro):
+        return isinstance(otro, _VistaCompacta) and otro.arbol is self.arbol and otro.nodo == self.nodo
+
+    def __hash__(self):
+        return hash((id(self.arbol), self.nodo))
+
+class FormaCompacta(_VistaCompacta):
+    @property
+    def nombre(self):
+        return self.arbol.nombre(self.nodo)
+
+    @nombre.setter
+    def nombre(self, nombre):
+        self.arbol.renombrar(self.nodo, nombre)
+
+class GrupoCompacto(_VistaCompacta):
+    @property
+    def formas(self) -> list:
+        return [self.arbol.vista(hijo) for hijo in self.arbol.hijos(self.nodo)]
+
+    def agregar(self, forma):
+        # Las vistas del mismo árbol se enlazan directamente; las formas y grupos normales se copian al árbol
+        if isinstance(forma, _VistaCompacta) and forma.arbol is self.arbol:
+            self.arbol.enlazar(self.nodo, forma.nodo)
+        else:
+            self.arbol.copiar(forma, self.nodo)
+
+    def eliminar(self, forma):
+        if forma not in self.formas:
+            raise ValueError("La forma no pertenece a este grupo")
+        self.arbol.desenlazar(forma.nodo)
 
 """
 En este ejemplo, tenemos la clase base Componente que define una operación dibujar(). Luego, tenemos la clase Forma, que 
@@ -49,53 +659,280 @@ tratar el grupo de formas como una entidad única.
 Ahora, podemos usar el patrón Composite para trabajar con formas individuales y grupos de formas de manera uniforme:
 """
 
-# Crear formas individuales
-circulo = Forma("Círculo")
-cuadrado = Forma("Cuadrado")
-triangulo = Forma("Triángulo")
-
-# Crear un grupo de formas y agregar formas individuales al grupo
-grupo1 = GrupoFormas()
-grupo1.agregar(circulo)
-grupo1.agregar(cuadrado)
-
-grupo2 = GrupoFormas()
-grupo2.agregar(triangulo)
-
-# Crear un grupo más grande y agregar los grupos anteriores al grupo compuesto
-grupo_compuesto = GrupoFormas()
-grupo_compuesto.agregar(grupo1)
-grupo_compuesto.agregar(grupo2)
-
-# Dibujar formas individuales
-print(circulo.dibujar())   # Output: Dibujando Círculo
-print(cuadrado.dibujar())  # Output: Dibujando Cuadrado
-
-# Dibujar grupos de formas (compuestos)
-print(grupo1.dibujar())
-# Output:
-# Grupo de formas:
-# Dibujando Círculo
-# Dibujando Cuadrado
-
-print(grupo2.dibujar())
-# Output:
-# Grupo de formas:
-# Dibujando Triángulo
-
-print(grupo_compuesto.dibujar())
-# Output:
-# Grupo de formas:
-# Dibujando Círculo
-# Dibujando Cuadrado
-# Grupo de formas:
-# Dibujando Triángulo
+def demo():
+    # Crear formas individuales
+    circulo = Forma("Círculo")
+    cuadrado = Forma("Cuadrado")
+    triangulo = Forma("Triángulo")
+
+    # Crear un grupo de formas y agregar formas individuales al grupo
+    grupo1 = GrupoFormas()
+    grupo1.agregar(circulo)
+    grupo1.agregar(cuadrado)
+
+    grupo2 = GrupoFormas()
+    grupo2.agregar(triangulo)
+
+    # Crear un grupo más grande y agregar los grupos anteriores al grupo compuesto
+    grupo_compuesto = GrupoFormas()
+    grupo_compuesto.agregar(grupo1)
+    grupo_compuesto.agregar(grupo2)
+
+    # Dibujar formas individuales
+    print(circulo.dibujar())   # Output: Dibujando Círculo
+    print(cuadrado.dibujar())  # Output: Dibujando Cuadrado
+
+    # Dibujar grupos de formas (compuestos)
+    print(grupo1.dibujar())
+    # Output:
+    # Grupo de formas:
+    # Dibujando Círculo
+    # Dibujando Cuadrado
+
+    print(grupo2.dibujar())
+    # Output:
+    # Grupo de formas:
+    # Dibujando Triángulo
+
+    print(grupo_compuesto.dibujar())
+    # Output:
+    # Grupo de formas:
+    # Dibujando Círculo
+    # Dibujando Cuadrado
+    # Grupo de formas:
+    # Dibujando Triángulo
+
+    # Escribir el dibujo por bloques en un archivo (aquí, la salida estándar)
+    grupo_compuesto.escribir_dibujo(sys.stdout)
+
+    # La misma jerarquía guardada en un árbol compacto; la vista se usa igual que un GrupoFormas
+    compacto = ArbolCompacto.desde_componente(grupo_compuesto).vista(0)
+    compacto.agregar(Forma("Hexágono"))
+    print(compacto.dibujar())
+
+    # Buscar una forma por nombre con el índice y obtener los grupos que la contienen
+    grupo_compuesto.activar_indice()
+    triangulo_encontrado = grupo_compuesto.buscar("Triángulo")
+    print(triangulo_encontrado is triangulo, grupo_compuesto.ruta(triangulo_encontrado) == [grupo_compuesto, grupo2])
 
 """
 En este ejemplo, hemos creado formas individuales y grupos de formas utilizando el patrón Composite. Las formas 
 individuales y los grupos de formas se tratan de manera uniforme mediante el método dibujar(), lo que nos permite 
 trabajar con estructuras complejas de forma más sencilla y consistente.
 
+GrupoFormas recorre el árbol con una pila explícita en lugar de llamarse recursivamente, así que los árboles muy 
+profundos no provocan RecursionError, y arma el resultado uniendo las partes una sola vez en lugar de concatenar cadenas 
+dentro del bucle. iterar_dibujo() entrega el mismo texto que dibujar() como un generador de bloques, y 
+escribir_dibujo() lo escribe directamente en un archivo o en un io.StringIO.
+
+Además, cada grupo guarda su dibujo en fragmentos: cadenas ya dibujadas intercaladas con referencias a sus subgrupos. 
+agregar(), eliminar() y cambiar el nombre de una Forma marcan como pendientes solo los grupos del camino hasta la raíz, 
+así que el siguiente dibujo vuelve a calcular esos grupos y reutiliza los fragmentos del resto del árbol. El atributo 
+recalculados indica cuántos nodos se volvieron a dibujar en el último dibujo. Los cambios hechos directamente sobre la 
+lista formas no se detectan; para eso están agregar() y eliminar(). Solo dibujar() guarda fragmentos: iterar_dibujo() y 
+escribir_dibujo() reutilizan los que ya existen, pero dibujan los grupos pendientes sobre la marcha sin guardarlos.
+
+Para árboles grandes, dibujar_paralelo() reparte el trabajo entre varios procesos: baja por el árbol hasta tener varios 
+subárboles por worker, los agrupa en bloques con una cantidad parecida de nodos y los envía a un pool de procesos en 
+una representación plana (preorden) que se puede serializar sin recursión. Los resultados se unen en el mismo orden que 
+usa dibujar(). El atributo estadisticas_paralelo informa los bytes enviados y el tiempo de serialización. Si el árbol 
+tiene menos nodos que el umbral, o si se pide un solo worker, se dibuja en serie.
+
+Por ahora este modo no compensa en árboles de formas simples: aplanar y serializar los subárboles en el proceso 
+principal ya cuesta cerca de dos tercios de un dibujo en serie (unos 0.3 s y 0.35 s frente a 0.75 s en un árbol de 10^6 
+nodos), así que ni con muchos núcleos se llega a ganar tiempo, y el umbral solo evita pagar ese costo en árboles 
+pequeños. Puede compensar cuando dibujar cada hoja es caro (hojas que no son Forma, que se envían completas).
+
+ArbolCompacto guarda la misma jerarquía sin un objeto por nodo: cada nodo es un índice, los enlaces (padre, primer 
+hijo, último hijo y siguiente hermano) son arreglos de enteros y los nombres de las hojas se guardan codificados en un 
+solo bytearray. vista() devuelve un GrupoCompacto o una FormaCompacta con la misma interfaz que GrupoFormas y Forma 
+(dibujar(), formas, agregar(), eliminar() y nombre), así que el código cliente no necesita saber qué representación 
+usa. El árbol compacto no guarda fragmentos: cada dibujo recorre los arreglos completos, y solo admite formas y grupos.
+
+buscar() encuentra una forma por nombre y ruta() devuelve los grupos que hay entre un grupo y una forma. Sin índice, 
+buscar() recorre el árbol. activar_indice() crea un IndiceNombres (nombre -> formas) que comparten todos los grupos bajo 
+esa raíz y que agregar(), eliminar() y el cambio de nombre de una Forma mantienen al día; con él, buscar() consulta el 
+diccionario y solo sube por los padres de la candidata, así que su costo depende de la profundidad y no del tamaño del 
+árbol. ruta() también sube por los padres, con o sin índice.
+
 En resumen, el patrón Composite es útil cuando necesitas tratar tanto a los objetos individuales como a las agrupaciones 
     de objetos de manera uniforme, lo que te permite trabajar con estructuras jerárquicas de forma más flexible y sencilla.
-"""
\ No newline at end of file
+"""
+
+
+# Implementación recursiva original de GrupoFormas.dibujar(), como referencia para el benchmark
+def _dibujar_recursivo(componente) -> str:
+    if not isinstance(componente, GrupoFormas):
+        return componente.dibujar()
+    resultado = "Grupo de formas:\n"
+    for forma in componente.formas:
+        resultado += _dibujar_recursivo(forma) + "\n"
+    return resultado
+
+
+# Árboles anchos y profundos: implementación recursiva original frente a dibujar() y escribir_dibujo()
+def benchmark_dibujo(ancho: int = 200_000, profundidad: int = 5000):
+    arbol_ancho = GrupoFormas()
+    for i in range(ancho):
+        arbol_ancho.agregar(Forma(f"Forma {i}"))
+
+    arbol_profundo = GrupoFormas()
+    grupo = arbol_profundo
+    for i in range(profundidad):
+        grupo.agregar(Forma(f"Forma {i}"))
+        subgrupo = GrupoFormas()
+        grupo.agregar(subgrupo)
+        grupo = subgrupo
+
+    for nombre, arbol in (("ancho", arbol_ancho), ("profundo", arbol_profundo)):
+        inicio = time.perf_counter()
+        try:
+            referencia = _dibujar_recursivo(arbol)
+            tiempo_recursivo = f"{(time.perf_counter() - inicio) * 1000:8.1f} ms"
+        except RecursionError:
+            referencia = None
+            tiempo_recursivo = "RecursionError"
+
+        inicio = time.perf_counter()
+        resultado = arbol.dibujar()
+        tiempo_iterativo = time.perf_counter() - inicio
+
+        salida = io.StringIO()
+        inicio = time.perf_counter()
+        arbol.escribir_dibujo(salida)
+        tiempo_streaming = time.perf_counter() - inicio
+
+        assert referencia is None or resultado == referencia
+        assert salida.getvalue() == resultado
+        print(f"Árbol {nombre}: recursivo {tiempo_recursivo}, dibujar() {tiempo_iterativo * 1000:8.1f} ms, "
+              f"escribir_dibujo() con fragmentos guardados {tiempo_streaming * 1000:8.1f} ms")
+
+
+# Árbol de tres niveles con ramas^3 formas, que usan los benchmarks de árboles de unos 10^6 nodos
+def _arbol_de_prueba(ramas: int) -> GrupoFormas:
+    raiz = GrupoFormas()
+    for i in range(ramas):
+        grupo = GrupoFormas()
+        raiz.agregar(grupo)
+        for j in range(ramas):
+            subgrupo = GrupoFormas()
+            grupo.agregar(subgrupo)
+            for k in range(ramas):
+                subgrupo.agregar(Forma(f"Forma {i}.{j}.{k}"))
+    return raiz
+
+
+# Cambiar una sola forma en un árbol de 10^6 nodos y volver a dibujarlo
+def benchmark_edicion(ramas: int = 100):
+    raiz = _arbol_de_prueba(ramas)
+
+    inicio = time.perf_counter()
+    raiz.dibujar()
+    tiempo_completo = time.perf_counter() - inicio
+    recalculados_completo = raiz.recalculados
+
+    random.choice(random.choice(random.choice(raiz.formas).formas).formas).nombre = "Forma editada"
+    inicio = time.perf_counter()
+    dibujo = raiz.dibujar()
+    tiempo_incremental = time.perf_counter() - inicio
+
+    assert "Dibujando Forma editada" in dibujo
+    print(f"Dibujo completo:     {tiempo_completo * 1000:8.1f} ms, {recalculados_completo:,} nodos recalculados")
+    print(f"Tras editar una hoja: {tiempo_incremental * 1000:8.1f} ms, {raiz.recalculados:,} nodos recalculados")
+
+
+# Escalado de dibujar_paralelo() con 1, 2, 4 y 8 workers sobre un árbol de unos 10^6 nodos
+def benchmark_paralelo(ramas: int = 100):
+    raiz = _arbol_de_prueba(ramas)
+
+    inicio = time.perf_counter()
+    referencia = _dibujar_recursivo(raiz)
+    print(f"Serie:      {(time.perf_counter() - inicio) * 1000:8.1f} ms ({os.cpu_count()} núcleos disponibles)")
+    for workers in (1, 2, 4, 8):
+        inicio = time.perf_counter()
+        dibujo = raiz.dibujar_paralelo(workers=workers)
+        duracion = time.perf_counter() - inicio
+        assert dibujo == referencia
+        # Con un solo worker dibujar_paralelo() cae al dibujo en serie
+        estadisticas = raiz.estadisticas_paralelo
+        detalle = (
+            f", serialización {estadisticas['tiempo_serializacion'] * 1000:.1f} ms "
+            f"({estadisticas['bytes_enviados'] / 1e6:.1f} MB)" if estadisticas else " (en serie)"
+        )
+        print(f"{workers} workers: {duracion * 1000:8.1f} ms{detalle}")
+
+
+# Memoria y tiempo de recorrido de un árbol de unos 10^6 nodos: objetos GrupoFormas y Forma frente a ArbolCompacto
+def benchmark_arbol_compacto(ramas: int = 100):
+    import tracemalloc
+
+    tracemalloc.start()
+    raiz = _arbol_de_prueba(ramas)
+    memoria_objetos = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    tracemalloc.start()
+    arbol = ArbolCompacto()
+    raiz_compacta = arbol.crear_grupo()
+    for i in range(ramas):
+        grupo = arbol.crear_grupo(raiz_compacta)
+        for j in range(ramas):
+            subgrupo = arbol.crear_grupo(grupo)
+            for k in range(ramas):
+                arbol.crear_forma(f"Forma {i}.{j}.{k}", subgrupo)
+    memoria_compacta = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    inicio = time.perf_counter()
+    referencia = raiz.dibujar()
+    tiempo_objetos = time.perf_counter() - inicio
+
+    inicio = time.perf_counter()
+    dibujo = arbol.vista(raiz_compacta).dibujar()
+    tiempo_compacto = time.perf_counter() - inicio
+
+    assert dibujo == referencia
+    print(f"{len(arbol):,} nodos")
+    print(f"Objetos:  {memoria_objetos / 1e6:8.1f} MB, primer dibujo {tiempo_objetos * 1000:8.1f} ms")
+    print(f"Compacto: {memoria_compacta / 1e6:8.1f} MB, dibujo        {tiempo_compacto * 1000:8.1f} ms")
+
+
+# Búsqueda por nombre en un árbol de unos 10^6 nodos: recorrido completo frente al índice, y memoria que ocupa el índice
+def benchmark_indice(ramas: int = 100, busquedas: int = 20):
+    import tracemalloc
+
+    raiz = _arbol_de_prueba(ramas)
+    nombres = [f"Forma {random.randrange(ramas)}.{random.randrange(ramas)}.{random.randrange(ramas)}"
+               for _ in range(busquedas)]
+
+    inicio = time.perf_counter()
+    esperadas = [raiz.buscar(nombre) for nombre in nombres]
+    tiempo_recorrido = (time.perf_counter() - inicio) / busquedas
+
+    tracemalloc.start()
+    inicio = time.perf_counter()
+    raiz.activar_indice()
+    tiempo_creacion = time.perf_counter() - inicio
+    memoria = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    repeticiones = 10_000
+    inicio = time.perf_counter()
+    for _ in range(repeticiones // busquedas):
+        encontradas = [raiz.buscar(nombre) for nombre in nombres]
+    tiempo_indice = (time.perf_counter() - inicio) / repeticiones
+
+    assert encontradas == esperadas
+    print(f"Recorrido completo: {tiempo_recorrido * 1e6:12.1f} µs por búsqueda")
+    print(f"Con índice:         {tiempo_indice * 1e6:12.1f} µs por búsqueda "
+          f"({tiempo_recorrido / tiempo_indice:,.0f}x más rápido)")
+    print(f"Índice: {len(raiz.activar_indice()):,} formas, {memoria / 1e6:.1f} MB, creado en {tiempo_creacion * 1000:.1f} ms")
+
+
+if __name__ == "__main__":
+    demo()
+    benchmark_dibujo()
+    benchmark_edicion()
+    benchmark_paralelo()
+    benchmark_arbol_compacto()
+    benchmark_indice()
@@ -11,6 +11,11 @@ ComponenteConcreto que implementa esa operación básica. Ahora, deseas agregar
 ComponenteConcreto, como opciones de decoración.
 """
 
+import bisect
+import time
+import weakref
+from collections import OrderedDict
+
 # Clase base Componente
 class Componente:
     def operacion(self):
@@ -23,21 +28,184 @@ class ComponenteConcreto(Componente):
 
 # Clase Decorador
 class Decorador(Componente):
+    # Texto que el decorador agrega antes y después del resultado de su componente
+    prefijo = sufijo = ""
+    # Atributos que cambian el resultado de una cadena fusionada. Al cambiar uno, se marcan para reconstruir solo las
+    # cadenas fusionadas que incluyen a este decorador (guardadas en _cadenas); los demás atributos no las afectan
+    _atributos_de_cadena = frozenset(("_componente", "prefijo", "sufijo", "__class__"))
+
     def __init__(self, componente):
         self._componente = componente
 
+    def __setattr__(self, nombre, valor):
+        super().__setattr__(nombre, valor)
+        if nombre in self._atributos_de_cadena:
+            for cadena in self.__dict__.get("_cadenas", ()):
+                cadena._vigente = False
+
+    def __getstate__(self):
+        # Las cadenas fusionadas registradas en esta capa no se serializan ni se copian: el WeakSet no se puede
+        # serializar, y una copia no forma parte de esas cadenas
+        estado = self.__dict__.copy()
+        estado.pop("_cadenas", None)
+        return estado
+
     def operacion(self):
         return self._componente.operacion()
 
+    def fusionar(self) -> "CadenaFusionada":
+        return CadenaFusionada(self)
+
 # Clases de Decoradores Concretos
 class DecoradorA(Decorador):
+    prefijo, sufijo = "Decorador A (", ")"
+
     def operacion(self):
-        return f"Decorador A ({self._componente.operacion()})"
+        return f"{self.prefijo}{self._componente.operacion()}{self.sufijo}"
 
 class DecoradorB(Decorador):
+    prefijo, sufijo = "Decorador B (", ")"
+
     def operacion(self):
-        return f"Decorador B ({self._componente.operacion()})"
-    
+        return f"{self.prefijo}{self._componente.operacion()}{self.sufijo}"
+
+# Decorador que guarda los resultados de operacion() según sus argumentos. Conserva como máximo tamano_maximo
+# resultados y descarta primero el usado hace más tiempo (LRU); con ttl, un resultado vence tantos segundos después de
+# calcularse
+class DecoradorCache(Decorador):
+    # Una cadena fusionada se detiene en este decorador y lo llama normalmente, así que sus atributos no necesitan
+    # avisar de cambios; se evita así el costo de Decorador.__setattr__ en cada llamada
+    __setattr__ = object.__setattr__
+
+    def __init__(self, componente, tamano_maximo: int = 128, ttl: float = None, reloj=time.monotonic):
+        super().__init__(componente)
+        self.tamano_maximo = tamano_maximo
+        self.ttl = ttl
+        self._reloj = reloj
+        # argumentos -> (resultado, instante en que vence o None)
+        self._resultados = OrderedDict()
+        self.aciertos = 0
+        self.fallos = 0
+        self.expulsiones = 0
+        self.vencidos = 0
+
+    def operacion(self, *args):
+        entrada = self._resultados.get(args)
+        if entrada is not None:
+            resultado, vence = entrada
+            if vence is None or self._reloj() < vence:
+                self._resultados.move_to_end(args)
+                self.aciertos += 1
+                return resultado
+            del self._resultados[args]
+            self.vencidos += 1
+        self.fallos += 1
+        resultado = self._componente.operacion(*args)
+        self._resultados[args] = (resultado, None if self.ttl is None else self._reloj() + self.ttl)
+        if len(self._resultados) > self.tamano_maximo:
+            self._resultados.popitem(last=False)
+            self.expulsiones += 1
+        return resultado
+
+    def invalidar(self):
+        self._resultados.clear()
+
+    def __len__(self):
+        return len(self._resultados)
+
+    @property
+    def tasa_aciertos(self) -> float:
+        total = self.aciertos + self.fallos
+        return self.aciertos / total if total else 0.0
+
+# Decorador que cuenta las llamadas a operacion() y arma un histograma de su duración. limites son los extremos
+# superiores (en segundos) de cada intervalo del histograma; el último intervalo recibe las llamadas más lentas. Si
+# está desactivado solo reenvía la llamada, sin medir nada
+class DecoradorMetricas(Decorador):
+    __setattr__ = object.__setattr__
+    LIMITES = (1e-6, 1e-5, 1e-4, 1e-3, 1e-2, 1e-1, 1.0)
+
+    def __init__(self, componente, activo: bool = True, limites: tuple = LIMITES):
+        super().__init__(componente)
+        self.activo = activo
+        self.limites = tuple(limites)
+        self.reiniciar()
+
+    def reiniciar(self):
+        self.llamadas = 0
+        self.tiempo_total = 0.0
+        self._cuentas = [0] * (len(self.limites) + 1)
+
+    def operacion(self, *args):
+        if not self.activo:
+            return self._componente.operacion(*args)
+        inicio = time.perf_counter()
+        try:
+            return self._componente.operacion(*args)
+        finally:
+            duracion = time.perf_counter() - inicio
+            self.llamadas += 1
+            self.tiempo_total += duracion
+            self._cuentas[bisect.bisect_left(self.limites, duracion)] += 1
+
+    def histograma(self) -> list:
+        # Pares (límite superior, cantidad de llamadas); el último límite es infinito
+        return list(zip(self.limites + (float("inf"),), self._cuentas))
+
+# Implementaciones de operacion() que solo agregan el prefijo y el sufijo del decorador, y que por eso se pueden
+# fusionar. Decorador.operacion ignora prefijo y sufijo, así que solo se fusiona si los dos están vacíos
+_OPERACIONES_FUSIONABLES = {Decorador.operacion, DecoradorA.operacion, DecoradorB.operacion}
+
+def _fusionable(componente) -> bool:
+    if not isinstance(componente, Decorador):
+        return False
+    operacion = type(componente).operacion
+    if operacion is Decorador.operacion:
+        return not (componente.prefijo or componente.sufijo)
+    return operacion in _OPERACIONES_FUSIONABLES
+
+# Callable equivalente a componente.operacion() que, en lugar de llamar capa por capa, une de antemano los prefijos y
+# sufijos de todas las capas fusionables y llama una sola vez a la operación del primer componente que no lo es (el
+# componente concreto o un decorador con su propia operacion()). Se reconstruye solo cuando cambió alguna de sus capas
+class CadenaFusionada:
+    def __init__(self, componente: Componente):
+        self.componente = componente
+        self._capas = []
+        self._reconstruir()
+
+    def _reconstruir(self):
+        # La cadena se registra en cada capa fusionada para que esa capa la marque si cambia
+        for capa in self._capas:
+            capa._cadenas.discard(self)
+        self._capas = []
+        self._vigente = True
+        prefijos = []
+        sufijos = []
+        componente = self.componente
+        while _fusionable(componente):
+            componente.__dict__.setdefault("_cadenas", weakref.WeakSet()).add(self)
+            self._capas.append(componente)
+            prefijos.append(componente.prefijo)
+            sufijos.append(componente.sufijo)
+            componente = componente._componente
+        prefijo = "".join(prefijos)
+        # El sufijo de la capa más interna va primero
+        sufijo = "".join(reversed(sufijos))
+        operacion = componente.operacion
+        if prefijo or sufijo:
+            self._operacion = lambda: f"{prefijo}{operacion()}{sufijo}"
+        else:
+            self._operacion = operacion
+
+    @property
+    def capas(self) -> int:
+        return len(self._capas)
+
+    def __call__(self):
+        if not self._vigente:
+            self._reconstruir()
+        return self._operacion()
+
 """
 En este ejemplo, tenemos la clase base Componente con un método operacion() que representa la operación básica. Luego, 
 tenemos la clase ComponenteConcreto, que es una implementación concreta de Componente.
@@ -52,24 +220,107 @@ funcionalidad adicional a la operación del componente.
 
 Ahora, podemos usar los decoradores para agregar características a un objeto ComponenteConcreto:
 """
-# Crear una instancia de ComponenteConcreto
-componente_concreto = ComponenteConcreto()
+def demo():
+    # Crear una instancia de ComponenteConcreto
+    componente_concreto = ComponenteConcreto()
+
+    # Agregar el DecoradorA
+    componente_decorado_a = DecoradorA(componente_concreto)
+    print(componente_decorado_a.operacion())
+    # Output: Decorador A (Operación básica)
+
+    # Agregar el DecoradorB
+    componente_decorado_b = DecoradorB(componente_concreto)
+    print(componente_decorado_b.operacion())
+    # Output: Decorador B (Operación básica)
 
-# Agregar el DecoradorA
-componente_decorado_a = DecoradorA(componente_concreto)
-print(componente_decorado_a.operacion())
-# Output: Decorador A (Operación básica)
+    # Fusionar una pila de decoradores en una sola llamada
+    pila = DecoradorA(DecoradorB(DecoradorA(componente_concreto)))
+    operacion = pila.fusionar()
+    print(operacion())
+    # Output: Decorador A (Decorador B (Decorador A (Operación básica)))
 
-# Agregar el DecoradorB
-componente_decorado_b = DecoradorB(componente_concreto)
-print(componente_decorado_b.operacion())
-# Output: Decorador B (Operación básica)
+    # Guardar el resultado y medir las llamadas
+    metricas = DecoradorMetricas(DecoradorCache(DecoradorA(componente_concreto), tamano_maximo=10, ttl=60))
+    for _ in range(3):
+        metricas.operacion()
+    print(metricas.llamadas, metricas._componente.aciertos, metricas._componente.fallos)
+    # Output: 3 2 1
 
 """
 En este ejemplo, hemos agregado el DecoradorA y el DecoradorB al objeto ComponenteConcreto, y cada decorador ha 
 proporcionado una funcionalidad adicional sin afectar la estructura del objeto original.
 
+Cada capa de decoradores agrega una llamada anidada a operacion(), así que una pila muy profunda es lenta y puede 
+provocar RecursionError. fusionar() devuelve una CadenaFusionada: un callable que da el mismo resultado que 
+operacion(), pero que une de antemano los prefijos y sufijos de las capas y llama una sola vez al componente del fondo. 
+Si una capa tiene su propia operacion(), la fusión se detiene en ella y la llama normalmente. Cambiar el componente, el 
+prefijo o el sufijo de una capa hace que se reconstruyan, en su siguiente llamada, solo las cadenas que incluyen esa 
+capa; los cambios en los atributos de las clases no se detectan. Con una o dos capas la comprobación de la cadena cuesta 
+más de lo que ahorra; la ganancia aparece en las pilas profundas.
+
+Los decoradores también sirven para agregar capas de rendimiento sin tocar el componente. DecoradorCache guarda los 
+resultados de operacion() según sus argumentos, con un tamaño máximo (descarta primero el resultado usado hace más 
+tiempo) y, opcionalmente, un tiempo de vida; informa aciertos, fallos, expulsiones y resultados vencidos. 
+DecoradorMetricas cuenta las llamadas y arma un histograma de su duración; desactivado (activo=False) solo reenvía la 
+llamada. Los dos son decoradores como los demás, así que se pueden apilar entre sí y con DecoradorA y DecoradorB; una 
+cadena fusionada se detiene en ellos y los llama normalmente.
+
 En resumen, el patrón Decorator es útil cuando necesitas agregar funcionalidad a un objeto de manera flexible y 
 dinámica, sin tener que modificar su código. Los decoradores te permiten componer funcionalidades y mantener tu código 
 limpio y extensible.
-"""
\ No newline at end of file
+"""
+
+
+# Latencia por llamada de operacion() frente a la cadena fusionada con pilas de 1, 10, 100 y 1000 capas
+def benchmark_fusion(llamadas: int = 2000):
+    for profundidad in (1, 10, 100, 1000):
+        componente = ComponenteConcreto()
+        for i in range(profundidad):
+            componente = (DecoradorA if i % 2 else DecoradorB)(componente)
+        fusionada = componente.fusionar()
+        referencia = fusionada()
+
+        try:
+            inicio = time.perf_counter()
+            for _ in range(llamadas):
+                resultado = componente.operacion()
+            tiempo_pila = f"{(time.perf_counter() - inicio) / llamadas * 1e6:10.2f} µs"
+            assert resultado == referencia
+        except RecursionError:
+            tiempo_pila = "RecursionError"
+
+        inicio = time.perf_counter()
+        for _ in range(llamadas):
+            fusionada()
+        tiempo_fusion = (time.perf_counter() - inicio) / llamadas
+        print(f"{profundidad:5} capas: pila {tiempo_pila:>14}, fusionada {tiempo_fusion * 1e6:10.2f} µs")
+
+
+# Costo por llamada de DecoradorCache (acierto y fallo) y DecoradorMetricas (activo y desactivado) frente al componente
+def benchmark_capas(llamadas: int = 200_000):
+    componente = ComponenteConcreto()
+    casos = (
+        ("ComponenteConcreto", componente),
+        ("Decorador", Decorador(componente)),
+        ("DecoradorCache, acierto", DecoradorCache(componente)),
+        # Con ttl=0 cada resultado vence enseguida, así que todas las llamadas son fallos
+        ("DecoradorCache, fallo", DecoradorCache(componente, ttl=0)),
+        ("DecoradorMetricas, activo", DecoradorMetricas(componente)),
+        ("DecoradorMetricas, desactivado", DecoradorMetricas(componente, activo=False)),
+    )
+    base = None
+    for nombre, capa in casos:
+        operacion = capa.operacion
+        inicio = time.perf_counter()
+        for _ in range(llamadas):
+            operacion()
+        duracion = (time.perf_counter() - inicio) / llamadas
+        base = base or duracion
+        print(f"{nombre:<32} {duracion * 1e9:8.0f} ns por llamada (+{(duracion - base) * 1e9:6.0f} ns)")
+
+
+if __name__ == "__main__":
+    demo()
+    benchmark_fusion()
+    benchmark_capas()
@@ -18,6 +18,12 @@ clases y subsistemas que se encargan de diferentes tareas, como verificar la ene
 detener los servicios antes de apagar la computadora.
 """
 
+import contextvars
+import itertools
+import time
+
+# asyncio se importa dentro de las funciones que lo usan: importar el módulo para usar la fachada sincrónica no lo carga
+
 # Subsistema para verificar la energía
 class VerificadorEnergia:
     @property
@@ -35,28 +41,453 @@ class DetenerServicios:
     def detener(self):
         print("Deteniendo servicios antes de apagar.")
 
+# Verificador que guarda el resultado de la verificación hasta que se invalida o, con ttl, hasta que pasan ttl segundos
+class VerificadorEnergiaMemoizado(VerificadorEnergia):
+    def __init__(self, ttl: float = None, reloj=time.monotonic):
+        self.ttl = ttl
+        self._reloj = reloj
+        self._encendida = None
+        self._vence = None
+
+    @property
+    def esta_encendida(self):
+        if self._encendida is None or (self._vence is not None and self._reloj() >= self._vence):
+            self._encendida = super().esta_encendida
+            self._vence = None if self.ttl is None else self._reloj() + self.ttl
+        return self._encendida
+
+    def invalidar(self):
+        self._encendida = None
+
+# Subsistemas compartidos por todas las fachadas, por clase y argumentos; cada uno se crea la primera vez que se pide
+_SUBSISTEMAS = {}
+
+def subsistema_compartido(clase, *args):
+    clave = (clase, args)
+    subsistema = _SUBSISTEMAS.get(clave)
+    if subsistema is None:
+        # Si dos hilos lo crean a la vez, setdefault() se queda con uno solo
+        subsistema = _SUBSISTEMAS.setdefault(clave, clase(*args))
+    return subsistema
+
+# Atributo de la fachada que obtiene el subsistema compartido la primera vez que se usa y lo guarda en la instancia.
+# Asignar el atributo reemplaza el subsistema de esa fachada. Dentro de una operación trazada de la fachada (en ese
+# contexto) entrega el subsistema envuelto en un _SubsistemaTrazado; la fachada nunca se modifica para trazarla
+class _SubsistemaPerezoso:
+    def __init__(self, obtener):
+        self._obtener = obtener
+
+    def __set_name__(self, propietario, nombre):
+        self._nombre = nombre
+
+    def __get__(self, fachada, propietario=None):
+        if fachada is None:
+            return self
+        try:
+            subsistema = fachada.__dict__[self._nombre]
+        except KeyError:
+            subsistema = fachada.__dict__[self._nombre] = self._obtener(fachada)
+        if _fachada_trazada.get() is fachada:
+            return _SubsistemaTrazado(subsistema)
+        return subsistema
+
+    def __set__(self, fachada, subsistema):
+        fachada.__dict__[self._nombre] = subsistema
+
+    def __delete__(self, fachada):
+        # El siguiente acceso vuelve a obtener el subsistema compartido
+        fachada.__dict__.pop(self._nombre, None)
+
+# Un intervalo de tiempo medido (tramo) dentro de una traza. Los instantes son de time.perf_counter_ns(), un reloj
+# monótono; padre es el id del tramo que estaba abierto cuando empezó este (None si no había ninguno)
+class Tramo:
+    __slots__ = ("id", "nombre", "atributos", "padre", "inicio", "fin", "_trazador", "_token")
+
+    def __init__(self, trazador: "Trazador", nombre: str, atributos: dict):
+        self.id = next(trazador._ids)
+        self.nombre = nombre
+        self.atributos = atributos
+        self._trazador = trazador
+        self.padre = self.inicio = self.fin = None
+
+    def __enter__(self):
+        actual = self._trazador._actual
+        padre = actual.get()
+        self.padre = None if padre is None else padre.id
+        self._token = actual.set(self)
+        self.inicio = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, tipo, error, traza):
+        self.fin = time.perf_counter_ns()
+        self._trazador._actual.reset(self._token)
+        if tipo is not None:
+            self.atributos["error"] = tipo.__name__
+        recolector = self._trazador.recolector
+        if recolector is not None:
+            recolector.registrar(self)
+
+    @property
+    def duracion(self) -> float:
+        return (self.fin - self.inicio) / 1e9
+
+    def como_dict(self) -> dict:
+        return {
+            "id": self.id, "nombre": self.nombre, "padre": self.padre, "atributos": self.atributos,
+            "inicio_ns": self.inicio, "fin_ns": self.fin, "duracion_ms": (self.fin - self.inicio) / 1e6,
+        }
+
+# Tramo que no mide nada, para cuando la traza está desactivada
+class _TramoNulo:
+    def __enter__(self):
+        return self
+
+    def __exit__(self, tipo, error, traza):
+        pass
+
+_TRAMO_NULO = _TramoNulo()
+
+# Recolector que guarda los tramos terminados en una lista. Cualquier objeto con un método registrar(tramo) sirve como
+# recolector
+class RecolectorMemoria:
+    def __init__(self):
+        self.tramos = []
+
+    def registrar(self, tramo: Tramo):
+        self.tramos.append(tramo)
+
+    def limpiar(self):
+        self.tramos.clear()
+
+# Crea los tramos y los entrega al recolector activo. El tramo abierto se guarda en una ContextVar, así que el
+# anidamiento funciona igual entre hilos y entre tareas de asyncio
+class Trazador:
+    def __init__(self):
+        self.recolector = None
+        self._actual = contextvars.ContextVar("tramo_actual", default=None)
+        self._ids = itertools.count(1)
+
+    @property
+    def activo(self) -> bool:
+        return self.recolector is not None
+
+    def activar(self, recolector=None):
+        self.recolector = recolector if recolector is not None else RecolectorMemoria()
+        return self.recolector
+
+    def desactivar(self):
+        self.recolector = None
+
+    def tramo(self, nombre: str, **atributos):
+        if self.recolector is None:
+            return _TRAMO_NULO
+        return Tramo(self, nombre, atributos)
+
+trazador = Trazador()
+
+# Envuelve un subsistema para que cada llamada a un método, y cada lectura de una propiedad (como esta_encendida), quede
+# medida en un tramo con el nombre Clase.atributo
+class _SubsistemaTrazado:
+    __slots__ = ("_subsistema",)
+
+    def __init__(self, subsistema):
+        self._subsistema = subsistema
+
+    def __getattr__(self, nombre):
+        subsistema = self._subsistema
+        clase = type(subsistema).__name__
+        if isinstance(getattr(type(subsistema), nombre, None), property):
+            with trazador.tramo(f"{clase}.{nombre}", subsistema=clase):
+                return getattr(subsistema, nombre)
+        valor = getattr(subsistema, nombre)
+        if not callable(valor):
+            return valor
+
+        def llamar(*args, **kwargs):
+            with trazador.tramo(f"{clase}.{nombre}", subsistema=clase):
+                return valor(*args, **kwargs)
+        return llamar
+
+# Fachada cuya operación se está trazando en este contexto. Mientras dura, sus atributos _SubsistemaPerezoso entregan
+# los subsistemas envueltos, y una subclase que llama a super().encender() no abre un segundo tramo raíz. Como es una
+# ContextVar, otros hilos y tareas que usan la misma fachada no se ven afectados
+_fachada_trazada = contextvars.ContextVar("fachada_trazada", default=None)
+
+# Ejecuta metodo(fachada) dentro de un tramo; la fachada sigue siendo self
+def _trazar_operacion(fachada, metodo):
+    token = _fachada_trazada.set(fachada)
+    try:
+        with trazador.tramo(f"{type(fachada).__name__}.{metodo.__name__}"):
+            return metodo(fachada)
+    finally:
+        _fachada_trazada.reset(token)
+
 # La fachada que simplifica la interacción con el sistema complejo
 class FachadaComputadora:
-    def __init__(self):
-        self.verificador_energia = VerificadorEnergia()
-        self.cargador_sistema_operativo = CargadorSistemaOperativo()
-        self.detener_servicios = DetenerServicios()
+    verificador_energia = _SubsistemaPerezoso(
+        lambda fachada: subsistema_compartido(VerificadorEnergiaMemoizado, fachada._ttl_sondeo)
+        if fachada._memoizar_sondeo else subsistema_compartido(VerificadorEnergia)
+    )
+    cargador_sistema_operativo = _SubsistemaPerezoso(lambda fachada: subsistema_compartido(CargadorSistemaOperativo))
+    detener_servicios = _SubsistemaPerezoso(lambda fachada: subsistema_compartido(DetenerServicios))
+
+    def __init__(self, memoizar_sondeo: bool = False, ttl_sondeo: float = None):
+        self._memoizar_sondeo = memoizar_sondeo
+        self._ttl_sondeo = ttl_sondeo
+
+    def invalidar_sondeo(self):
+        invalidar = getattr(self.verificador_energia, "invalidar", None)
+        if invalidar is not None:
+            invalidar()
 
+    # Con la traza desactivada el único costo es comprobar trazador.recolector; con la traza activada, la operación se
+    # ejecuta dentro de _trazar_operacion() (la segunda comprobación evita que se trace dos veces)
     def encender(self):
+        if trazador.recolector is not None and _fachada_trazada.get() is not self:
+            return _trazar_operacion(self, FachadaComputadora.encender)
         if not self.verificador_energia.esta_encendida:
             self.cargador_sistema_operativo.cargar()
+            # El estado de la energía cambió: la verificación guardada ya no sirve
+            self.invalidar_sondeo()
             print("Encendiendo la computadora.")
             return
         print("la computadora ya se encontraba encendida")
 
 
     def apagar(self):
+        if trazador.recolector is not None and _fachada_trazada.get() is not self:
+            return _trazar_operacion(self, FachadaComputadora.apagar)
         if self.verificador_energia.esta_encendida:
             self.detener_servicios.detener()
+            self.invalidar_sondeo()
             print("Apagando la computadora.")
             return
         print("la computadora ya se encontraba apagada")
 
+# Un paso del encendido o del apagado: funcion es una función asíncrona sin argumentos, depende_de son los nombres de
+# los pasos que deben terminar antes y timeout es el tiempo máximo (en segundos) que puede tardar el paso
+class Paso:
+    def __init__(self, nombre: str, funcion, depende_de: tuple = (), timeout: float = None):
+        self.nombre = nombre
+        self.funcion = funcion
+        self.depende_de = tuple(depende_de)
+        self.timeout = timeout
+
+# Adapta una función sincrónica (por ejemplo, un método de los subsistemas originales) para usarla en un Paso: se
+# ejecuta en un hilo, así que no bloquea a los demás pasos
+def en_hilo(funcion):
+    import asyncio
+
+    async def ejecutar():
+        return await asyncio.to_thread(funcion)
+    return ejecutar
+
+# Ordena los pasos de forma que cada uno quede después de sus dependencias
+def ordenar_pasos(pasos: list) -> list:
+    nombres = set()
+    for paso in pasos:
+        if paso.nombre in nombres:
+            raise ValueError(f"Hay dos pasos llamados '{paso.nombre}'")
+        nombres.add(paso.nombre)
+    for paso in pasos:
+        for dependencia in paso.depende_de:
+            if dependencia not in nombres:
+                raise ValueError(f"El paso '{paso.nombre}' depende de '{dependencia}', que no existe")
+
+    orden = []
+    listos = set()
+    pendientes = list(pasos)
+    while pendientes:
+        siguientes = [paso for paso in pendientes if listos.issuperset(paso.depende_de)]
+        if not siguientes:
+            raise ValueError(f"Dependencia circular entre los pasos {', '.join(paso.nombre for paso in pendientes)}")
+        orden.extend(siguientes)
+        listos.update(paso.nombre for paso in siguientes)
+        pendientes = [paso for paso in pendientes if paso.nombre not in listos]
+    return orden
+
+async def _ejecutar_paso(paso: Paso, dependencias: list):
+    import asyncio
+
+    if dependencias:
+        await asyncio.gather(*dependencias)
+    try:
+        with trazador.tramo(f"paso {paso.nombre}", depende_de=list(paso.depende_de), timeout=paso.timeout):
+            return await asyncio.wait_for(paso.funcion(), paso.timeout)
+    except asyncio.TimeoutError:
+        raise TimeoutError(f"El paso '{paso.nombre}' superó el tiempo límite de {paso.timeout} s") from None
+
+# Ejecuta los pasos de forma concurrente: cada uno empieza apenas terminan sus dependencias. Devuelve el resultado de
+# cada paso por nombre. Si un paso falla (o supera su tiempo límite), se cancelan los demás y se propaga el error
+async def ejecutar_pasos(pasos: list) -> dict:
+    import asyncio
+
+    tareas = {}
+    for paso in ordenar_pasos(pasos):
+        dependencias = [tareas[nombre] for nombre in paso.depende_de]
+        tareas[paso.nombre] = asyncio.create_task(_ejecutar_paso(paso, dependencias), name=paso.nombre)
+    try:
+        return dict(zip(tareas, await asyncio.gather(*tareas.values())))
+    except BaseException:
+        for tarea in tareas.values():
+            tarea.cancel()
+        raise
+
+# Fachada asíncrona: el encendido y el apagado son listas de pasos con dependencias declaradas, y los pasos
+# independientes se ejecutan al mismo tiempo. Sin argumentos usa los subsistemas originales, con los mismos mensajes
+# que FachadaComputadora. encender() y apagar() son envoltorios sincrónicos para el código que ya usaba la fachada
+class FachadaComputadoraAsync:
+    def __init__(self, verificador_energia=None, pasos_encendido: list = None, pasos_apagado: list = None):
+        if verificador_energia is None:
+            verificador = subsistema_compartido(VerificadorEnergia)
+            verificador_energia = en_hilo(lambda: verificador.esta_encendida)
+        self.verificador_energia = verificador_energia
+        self.pasos_encendido = pasos_encendido if pasos_encendido is not None else [
+            Paso("sistema_operativo", en_hilo(subsistema_compartido(CargadorSistemaOperativo).cargar)),
+        ]
+        self.pasos_apagado = pasos_apagado if pasos_apagado is not None else [
+            Paso("servicios", en_hilo(subsistema_compartido(DetenerServicios).detener)),
+        ]
+        # Se validan las dependencias al crear la fachada y no al primer encendido
+        ordenar_pasos(self.pasos_encendido)
+        ordenar_pasos(self.pasos_apagado)
+
+    async def encender_async(self):
+        with trazador.tramo("FachadaComputadoraAsync.encender"):
+            with trazador.tramo("verificador_energia"):
+                encendida = await self.verificador_energia()
+            if not encendida:
+                await ejecutar_pasos(self.pasos_encendido)
+                print("Encendiendo la computadora.")
+                return
+            print("la computadora ya se encontraba encendida")
+
+    async def apagar_async(self):
+        with trazador.tramo("FachadaComputadoraAsync.apagar"):
+            with trazador.tramo("verificador_energia"):
+                encendida = await self.verificador_energia()
+            if encendida:
+                await ejecutar_pasos(self.pasos_apagado)
+                print("Apagando la computadora.")
+                return
+            print("la computadora ya se encontraba apagada")
+
+    # asyncio.run() no se puede usar dentro de un event loop en marcha: ahí hay que esperar encender_async()
+    def encender(self):
+        import asyncio
+
+        asyncio.run(self.encender_async())
+
+    def apagar(self):
+        import asyncio
+
+        asyncio.run(self.apagar_async())
+
+    @classmethod
+    def simulada(cls, latencias: dict = None, timeout: float = 5.0) -> "FachadaComputadoraAsync":
+        # Fachada con subsistemas que solo esperan (como si hicieran E/S lenta) el tiempo indicado en latencias
+        latencias = {**LATENCIAS_SIMULADAS, **(latencias or {})}
+        energia = VerificadorEnergiaSimulado(latencias["energia"])
+        discos = SubsistemaSimulado("discos", latencias["discos"])
+        red = SubsistemaSimulado("red", latencias["red"])
+        sistema_operativo = SubsistemaSimulado("sistema_operativo", latencias["sistema_operativo"])
+        servicios = SubsistemaSimulado("servicios", latencias["servicios"])
+        return cls(
+            energia.esta_encendida,
+            pasos_encendido=[
+                Paso("energia", energia.encender, timeout=timeout),
+                Paso("discos", discos.ejecutar, ("energia",), timeout),
+                Paso("red", red.ejecutar, ("energia",), timeout),
+                Paso("sistema_operativo", sistema_operativo.ejecutar, ("discos",), timeout),
+                Paso("servicios", servicios.ejecutar, ("sistema_operativo", "red"), timeout),
+            ],
+            pasos_apagado=[
+                Paso("servicios", servicios.ejecutar, timeout=timeout),
+                Paso("red", red.ejecutar, ("servicios",), timeout),
+                Paso("discos", discos.ejecutar, ("servicios",), timeout),
+                Paso("energia", energia.apagar, ("red", "discos"), timeout),
+            ],
+        )
+
+# Latencias (en segundos) de los subsistemas simulados
+LATENCIAS_SIMULADAS = {"energia": 0.05, "discos": 0.1, "red": 0.15, "sistema_operativo": 0.1, "servicios": 0.05}
+
+# Subsistema que simula una operación de E/S lenta
+class SubsistemaSimulado:
+    def __init__(self, nombre: str, latencia: float):
+        self.nombre = nombre
+        self.latencia = latencia
+        self.ejecuciones = 0
+
+    async def ejecutar(self):
+        import asyncio
+
+        await asyncio.sleep(self.latencia)
+        self.ejecuciones += 1
+
+# Verificador de energía simulado: recuerda si la computadora está encendida
+class VerificadorEnergiaSimulado:
+    def __init__(self, latencia: float, encendida: bool = False):
+        self.latencia = latencia
+        self.encendida = encendida
+
+    async def esta_encendida(self) -> bool:
+        return self.encendida
+
+    async def encender(self):
+        import asyncio
+
+        await asyncio.sleep(self.latencia)
+        self.encendida = True
+
+    async def apagar(self):
+        import asyncio
+
+        await asyncio.sleep(self.latencia)
+        self.encendida = False
+
+
+# Desglose de los tramos como árbol: cada fila muestra la duración, la fracción del tramo raíz y una barra que indica
+# cuándo empezó y cuánto duró dentro de la raíz, así que los pasos concurrentes aparecen superpuestos
+def reporte_tramos(tramos: list, ancho: int = 40) -> str:
+    ids = {tramo.id for tramo in tramos}
+    hijos = {}
+    for tramo in sorted(tramos, key=lambda tramo: tramo.inicio):
+        hijos.setdefault(tramo.padre if tramo.padre in ids else None, []).append(tramo)
+    lineas = []
+    for raiz in hijos.get(None, []):
+        total = (raiz.fin - raiz.inicio) or 1
+        pila = [(raiz, 0)]
+        while pila:
+            tramo, nivel = pila.pop()
+            duracion = tramo.fin - tramo.inicio
+            desde = round((tramo.inicio - raiz.inicio) / total * ancho)
+            barra = " " * desde + "#" * max(1, round(duracion / total * ancho))
+            lineas.append(f"{'  ' * nivel + tramo.nombre:<45} {duracion / 1e6:9.3f} ms {duracion / total:7.1%} "
+                          f"|{barra:<{ancho}}|")
+            pila.extend((hijo, nivel + 1) for hijo in reversed(hijos.get(tramo.id, [])))
+    return "\n".join(lineas)
+
+def tramos_a_json(tramos: list) -> str:
+    import json
+
+    return json.dumps([tramo.como_dict() for tramo in tramos], ensure_ascii=False, indent=2)
+
+# Traza el encendido de la fachada sincrónica y de una fachada asíncrona simulada, imprime el desglose y, si se indica
+# una ruta, exporta los tramos en JSON. Devuelve los tramos registrados
+def perfil_encendido(ruta_json: str = None) -> list:
+    anterior = trazador.recolector
+    recolector = trazador.activar()
+    try:
+        FachadaComputadora(memoizar_sondeo=True).encender()
+        FachadaComputadoraAsync.simulada().encender()
+    finally:
+        trazador.recolector = anterior
+    print(reporte_tramos(recolector.tramos))
+    if ruta_json is not None:
+        with open(ruta_json, "w", encoding="utf-8") as archivo:
+            archivo.write(tramos_a_json(recolector.tramos))
+    return recolector.tramos
 
 """
 En este ejemplo, tenemos tres clases que representan subsistemas dentro del sistema completo. Luego, creamos la clase 
@@ -66,29 +497,173 @@ de interactuar con los subsistemas y oculta toda la complejidad interna de cómo
 Ahora podemos usar la fachada para interactuar con el sistema de manera simple:
 """
 
-# Crear una instancia de la fachada
-computadora = FachadaComputadora()
+def demo():
+    # Crear una instancia de la fachada
+    computadora = FachadaComputadora()
+
+    # Encender la computadora (utiliza los subsistemas internos)
+    computadora.encender()
+    # Output:
+    # Verificando si la energía está encendida.
+    # Cargando el sistema operativo.
+    # Encendiendo la computadora.
+
+    # Apagar la computadora (utiliza los subsistemas internos)
+    computadora.apagar()
+    # Output:
+    # Deteniendo servicios antes de apagar.
+    # Apagando la computadora.
 
-# Encender la computadora (utiliza los subsistemas internos)
-computadora.encender()
-# Output:
-# Verificando si la energía está encendida.
-# Cargando el sistema operativo.
-# Encendiendo la computadora.
+    # Fachada que guarda la verificación de la energía: la segunda llamada no vuelve a verificar
+    computadora_memoizada = FachadaComputadora(memoizar_sondeo=True)
+    computadora_memoizada.encender()
+    computadora_memoizada.encender()
+    # Output:
+    # Verificando si la energía está encendida.
+    # la computadora ya se encontraba encendida
+    # la computadora ya se encontraba encendida
 
-# Apagar la computadora (utiliza los subsistemas internos)
-computadora.apagar()
-# Output:
-# Deteniendo servicios antes de apagar.
-# Apagando la computadora.
+    # Fachada asíncrona con subsistemas simulados: los pasos independientes se ejecutan al mismo tiempo
+    computadora_async = FachadaComputadoraAsync.simulada()
+    computadora_async.encender()
+    # Output: Encendiendo la computadora.
+    computadora_async.apagar()
+    # Output: Apagando la computadora.
 
 """
 En este ejemplo, hemos utilizado la fachada FachadaComputadora para encender y apagar la computadora sin necesidad de 
 conocer todos los detalles internos del sistema. La fachada proporciona una interfaz simple que oculta la complejidad de 
 los subsistemas y simplifica la interacción con el sistema.
 
+La fachada no crea sus subsistemas al construirse: cada uno se obtiene la primera vez que se usa, y todas las fachadas 
+comparten las mismas instancias (subsistema_compartido()), así que crear una fachada por petición no cuesta casi nada. 
+Asignar un atributo, por ejemplo fachada.detener_servicios = OtroSubsistema(), reemplaza el subsistema solo en esa 
+fachada. Con memoizar_sondeo=True la fachada usa un VerificadorEnergiaMemoizado compartido, que guarda el resultado de 
+esta_encendida hasta que se invalida (invalidar_sondeo(), que encender() y apagar() llaman al cambiar el estado) o, con 
+ttl_sondeo, hasta que pasa ese tiempo.
+
+Cuando los subsistemas hacen E/S lenta, llamarlos uno tras otro hace que el encendido tarde la suma de todos los pasos. 
+FachadaComputadoraAsync describe el encendido y el apagado como listas de Paso, cada uno con sus dependencias y un 
+tiempo límite opcional. ejecutar_pasos() lanza cada paso apenas terminan sus dependencias, así que el tiempo total pasa 
+a ser el del camino crítico (la cadena de dependencias más lenta). Si un paso falla o supera su tiempo límite, los demás 
+se cancelan y se propaga el error; las dependencias inexistentes o circulares se detectan al crear la fachada. 
+encender() y apagar() siguen siendo sincrónicos para el código existente; dentro de un event loop se usan 
+encender_async() y apagar_async(). en_hilo() permite usar los subsistemas sincrónicos originales como pasos.
+
+Para saber qué subsistema hace lento el encendido, trazador.activar() activa la traza: cada operación de la fachada y 
+cada llamada que hace a un subsistema (y, en la fachada asíncrona, cada paso) queda medida en un Tramo con un reloj 
+monótono, su tramo padre y sus atributos. Los tramos terminados van al recolector, RecolectorMemoria por defecto o 
+cualquier objeto con un método registrar(tramo). reporte_tramos() imprime el desglose como árbol con una barra de tiempo 
+por tramo, tramos_a_json() los exporta, y perfil_encendido() hace las dos cosas con un encendido de prueba. Con la traza 
+desactivada, la fachada solo comprueba trazador.recolector en cada operación, y cada acceso a un subsistema comprueba si 
+hay una operación trazada de esa fachada en curso. La traza no modifica la fachada, así que varios hilos pueden usar la 
+misma fachada, con o sin traza, al mismo tiempo.
+
 En resumen, el patrón Facade es útil cuando tienes un sistema complejo con múltiples clases y subsistemas y deseas 
 proporcionar una interfaz simple y unificada para interactuar con el sistema sin tener que conocer todos los detalles 
 internos. La fachada simplifica el acceso a funcionalidades complejas y reduce el acoplamiento entre los componentes 
 del sistema.
-"""
\ No newline at end of file
+"""
+
+
+# Costo de crear una fachada y de cada llamada a encender(): subsistemas creados al construir la fachada y verificación
+# en cada llamada (la implementación original) frente a subsistemas compartidos y verificación memoizada
+def benchmark_fachada(repeticiones: int = 100_000):
+    import contextlib
+    import io
+
+    class FachadaOriginal(FachadaComputadora):
+        def __init__(self):
+            self.verificador_energia = VerificadorEnergia()
+            self.cargador_sistema_operativo = CargadorSistemaOperativo()
+            self.detener_servicios = DetenerServicios()
+
+    for nombre, crear in (
+        ("Original", FachadaOriginal),
+        ("Perezosa", FachadaComputadora),
+        ("Perezosa con sondeo memoizado", lambda: FachadaComputadora(memoizar_sondeo=True)),
+    ):
+        inicio = time.perf_counter()
+        for _ in range(repeticiones):
+            crear()
+        tiempo_creacion = (time.perf_counter() - inicio) / repeticiones
+
+        fachada = crear()
+        with contextlib.redirect_stdout(io.StringIO()):
+            inicio = time.perf_counter()
+            for _ in range(repeticiones):
+                fachada.encender()
+            tiempo_llamada = (time.perf_counter() - inicio) / repeticiones
+        print(f"{nombre:<30} creación {tiempo_creacion * 1e9:6.0f} ns, encender() {tiempo_llamada * 1e9:6.0f} ns")
+
+# Costo de encender() sin la comprobación de la traza, con la traza desactivada y con la traza activada
+def benchmark_traza(repeticiones: int = 100_000):
+    import contextlib
+    import io
+
+    class FachadaSinTraza(FachadaComputadora):
+        def encender(self):
+            if not self.verificador_energia.esta_encendida:
+                self.cargador_sistema_operativo.cargar()
+                self.invalidar_sondeo()
+                print("Encendiendo la computadora.")
+                return
+            print("la computadora ya se encontraba encendida")
+
+    recolector = RecolectorMemoria()
+    resultados = {}
+    with contextlib.redirect_stdout(io.StringIO()):
+        for nombre, fachada, activa in (
+            ("Sin traza", FachadaSinTraza(), False),
+            ("Traza desactivada", FachadaComputadora(), False),
+            ("Traza activada", FachadaComputadora(), True),
+        ):
+            trazador.recolector = recolector if activa else None
+            inicio = time.perf_counter()
+            for _ in range(repeticiones):
+                fachada.encender()
+            resultados[nombre] = (time.perf_counter() - inicio) / repeticiones
+            trazador.desactivar()
+    base = resultados["Sin traza"]
+    for nombre, duracion in resultados.items():
+        print(f"{nombre:<20} {duracion * 1e9:7.0f} ns por encender() ({(duracion - base) / base:+.1%})")
+    print(f"{len(recolector.tramos):,} tramos registrados")
+
+# Duración del camino más lento de la lista de pasos, según la latencia de cada uno
+def _camino_critico(pasos: list, latencias: dict) -> float:
+    fin = {}
+    for paso in ordenar_pasos(pasos):
+        fin[paso.nombre] = max((fin[nombre] for nombre in paso.depende_de), default=0.0) + latencias[paso.nombre]
+    return max(fin.values())
+
+# Encendido con subsistemas simulados: pasos uno tras otro frente a ejecutar_pasos()
+def benchmark_encendido():
+    import asyncio
+
+    latencias = LATENCIAS_SIMULADAS
+    pasos = FachadaComputadoraAsync.simulada(latencias).pasos_encendido
+
+    async def en_serie():
+        for paso in ordenar_pasos(pasos):
+            await paso.funcion()
+
+    inicio = time.perf_counter()
+    asyncio.run(en_serie())
+    tiempo_serie = time.perf_counter() - inicio
+
+    inicio = time.perf_counter()
+    asyncio.run(ejecutar_pasos(pasos))
+    tiempo_concurrente = time.perf_counter() - inicio
+
+    print(f"Suma de los pasos: {sum(latencias.values()) * 1000:6.0f} ms, "
+          f"camino crítico: {_camino_critico(pasos, latencias) * 1000:6.0f} ms")
+    print(f"En serie:          {tiempo_serie * 1000:6.0f} ms")
+    print(f"Concurrente:       {tiempo_concurrente * 1000:6.0f} ms")
+
+
+if __name__ == "__main__":
+    demo()
+    benchmark_fachada()
+    benchmark_encendido()
+    benchmark_traza()
+    perfil_encendido()
@@ -17,6 +17,12 @@ Supongamos que tenemos una clase Imagen que representa una imagen que se carga d
 proxy para cargar la imagen desde el disco solo cuando se solicite y no antes.
 
 """
+
+import os
+import threading
+import time
+from collections import OrderedDict
+
 # Clase base: Interfaz de la imagen
 class Imagen:
     def mostrar(self):
@@ -30,23 +36,100 @@ class ImagenReal(Imagen):
 
     def cargar_desde_disco(self):
         print(f"Cargando imagen desde el disco: {self.ruta_archivo}")
+        # Bytes que ocupa la imagen cargada (0 si el archivo no existe, como en el ejemplo)
+        self.tamano = os.path.getsize(self.ruta_archivo) if os.path.isfile(self.ruta_archivo) else 0
 
     def mostrar(self):
         print(f"Mostrando imagen: {self.ruta_archivo}")
 
+# Caché de imágenes cargadas, por ruta, compartida por todos los proxies. Cada ruta se carga una sola vez mientras esté
+# en la caché; si los bytes de las imágenes superan el presupuesto, se descartan primero las usadas hace más tiempo (LRU)
+class CacheImagenes:
+    def __init__(self, presupuesto_bytes: int = 256 * 2**20, cargar=ImagenReal):
+        self.presupuesto_bytes = presupuesto_bytes
+        # Función que carga la imagen de una ruta; la imagen debe tener el atributo tamano (en bytes)
+        self._cargar = cargar
+        self._imagenes = OrderedDict()
+        self._lock = threading.Lock()
+        # Rutas que se están cargando -> evento que se activa cuando termina la carga
+        self._cargando = {}
+        self.bytes_usados = 0
+        self.aciertos = 0
+        self.fallos = 0
+        self.expulsiones = 0
+
+    def obtener(self, ruta_archivo: str) -> Imagen:
+        while True:
+            with self._lock:
+                imagen = self._imagenes.get(ruta_archivo)
+                if imagen is not None:
+                    self._imagenes.move_to_end(ruta_archivo)
+                    self.aciertos += 1
+                    return imagen
+                evento = self._cargando.get(ruta_archivo)
+                if evento is None:
+                    evento = self._cargando[ruta_archivo] = threading.Event()
+                    self.fallos += 1
+                    break
+            # Otro hilo ya está cargando esta ruta: se espera a que termine y se vuelve a buscar (si la carga falló,
+            # este hilo la intenta de nuevo)
+            evento.wait()
+
+        # La carga se hace sin el lock, así que una carga lenta no bloquea a las demás rutas
+        try:
+            imagen = self._cargar(ruta_archivo)
+        except BaseException:
+            with self._lock:
+                del self._cargando[ruta_archivo]
+            evento.set()
+            raise
+        with self._lock:
+            del self._cargando[ruta_archivo]
+            self._imagenes[ruta_archivo] = imagen
+            self.bytes_usados += imagen.tamano
+            # La imagen recién cargada se conserva aunque supere el presupuesto por sí sola
+            while self.bytes_usados > self.presupuesto_bytes and len(self._imagenes) > 1:
+                _, descartada = self._imagenes.popitem(last=False)
+                self.bytes_usados -= descartada.tamano
+                self.expulsiones += 1
+        evento.set()
+        return imagen
+
+    def cargada(self, ruta_archivo: str) -> Imagen:
+        # La imagen de la ruta si está en la caché, o None; no la carga ni cambia el orden LRU
+        return self._imagenes.get(ruta_archivo)
+
+    def limpiar(self):
+        with self._lock:
+            self._imagenes.clear()
+            self.bytes_usados = 0
+
+    def __len__(self):
+        return len(self._imagenes)
+
+    @property
+    def tasa_aciertos(self) -> float:
+        total = self.aciertos + self.fallos
+        return self.aciertos / total if total else 0.0
+
+cache_imagenes = CacheImagenes()
+
 # Clase Proxy: ProxyImagen
 class ProxyImagen(Imagen):
-    def __init__(self, ruta_archivo):
+    def __init__(self, ruta_archivo, cache: CacheImagenes = None):
         self.ruta_archivo = ruta_archivo
-        self.imagen_real = None
+        # El proxy no guarda la imagen: la pide a la caché en cada uso, así que si fue descartada se vuelve a cargar
+        self.cache = cache if cache is not None else cache_imagenes
+
+    @property
+    def imagen_real(self):
+        return self.cache.cargada(self.ruta_archivo)
 
     def cargar_desde_disco(self):
-        if self.imagen_real is None:
-            self.imagen_real = ImagenReal(self.ruta_archivo)
+        return self.cache.obtener(self.ruta_archivo)
 
     def mostrar(self):
-        self.cargar_desde_disco()
-        self.imagen_real.mostrar()
+        self.cargar_desde_disco().mostrar()
 
 """
 En este ejemplo, tenemos una clase ImagenReal que representa la imagen real que se carga desde el disco. El proxy, 
@@ -59,25 +142,93 @@ De esta manera, el cliente interactúa con el proxy, que a su vez maneja la inte
 Ahora podemos utilizar el proxy para mostrar la imagen:
 """
 
-# Crear el proxy con la ruta de archivo de la imagen
-proxy_imagen = ProxyImagen("imagen.png")
+def demo():
+    # Crear el proxy con la ruta de archivo de la imagen
+    proxy_imagen = ProxyImagen("imagen.png")
 
-# La imagen real aún no se ha cargado desde el disco
-# La carga real se produce solo cuando se llama a 'mostrar()'
-proxy_imagen.mostrar()
-# Output: Cargando imagen desde el disco: imagen.png
-#         Mostrando imagen: imagen.png
+    # La imagen real aún no se ha cargado desde el disco
+    # La carga real se produce solo cuando se llama a 'mostrar()'
+    proxy_imagen.mostrar()
+    # Output: Cargando imagen desde el disco: imagen.png
+    #         Mostrando imagen: imagen.png
 
-# La imagen real ya se ha cargado, la carga no se produce nuevamente
-proxy_imagen.mostrar()
-# Output: Mostrando imagen: imagen.png
+    # La imagen real ya se ha cargado, la carga no se produce nuevamente
+    proxy_imagen.mostrar()
+    # Output: Mostrando imagen: imagen.png
+
+    # Otro proxy de la misma ruta usa la imagen que ya está en la caché compartida
+    ProxyImagen("imagen.png").mostrar()
+    # Output: Mostrando imagen: imagen.png
+    print(cache_imagenes.aciertos, cache_imagenes.fallos)
 
 """
 En este ejemplo, hemos utilizado el proxy ProxyImagen para cargar la imagen real desde el disco solo cuando se llama al 
 método mostrar(). Si el cliente no utiliza la imagen, no se carga desde el disco, lo que puede mejorar el rendimiento y 
 la eficiencia en situaciones donde cargar la imagen es costoso.
 
+Los proxies no guardan su propia imagen: todos usan una CacheImagenes compartida (cache_imagenes), por ruta, así que 
+muchos proxies de la misma ruta comparten una sola imagen cargada. Cuando los bytes de las imágenes superan 
+presupuesto_bytes, la caché descarta las usadas hace más tiempo, y un proxy cuya imagen fue descartada la vuelve a cargar 
+la próxima vez que se usa. aciertos, fallos, expulsiones y bytes_usados permiten ajustar el presupuesto.
+
 En resumen, el patrón Proxy se utiliza para controlar el acceso a un objeto y proporcionar una representación o 
 funcionalidad adicional. El proxy actúa como intermediario y puede ayudar a mejorar el rendimiento y la eficiencia al 
 retrasar la creación o carga del objeto real hasta que sea necesario.
-"""
\ No newline at end of file
+"""
+
+
+# 100.000 proxies sobre 1.000 archivos, con algunos archivos mucho más usados que otros: un proxy con su propia imagen
+# (la implementación original) frente a la caché compartida con distintos presupuestos
+def benchmark_cache(proxies: int = 100_000, archivos: int = 1000, tamano: int = 100_000):
+    import random
+
+    # Imagen que simula la carga sin leer ningún archivo ni imprimir
+    class ImagenSimulada(Imagen):
+        cargas = 0
+
+        def __init__(self, ruta_archivo):
+            self.ruta_archivo = ruta_archivo
+            self.tamano = tamano
+            ImagenSimulada.cargas += 1
+
+        def mostrar(self):
+            pass
+
+    class ProxyOriginal(Imagen):
+        def __init__(self, ruta_archivo):
+            self.ruta_archivo = ruta_archivo
+            self.imagen_real = None
+
+        def mostrar(self):
+            if self.imagen_real is None:
+                self.imagen_real = ImagenSimulada(self.ruta_archivo)
+            self.imagen_real.mostrar()
+
+    generador = random.Random(0)
+    rutas = [f"imagen_{i}.png" for i in range(archivos)]
+    pesos = [1 / (i + 1) for i in range(archivos)]
+    elegidas = generador.choices(rutas, pesos, k=proxies)
+
+    ImagenSimulada.cargas = 0
+    inicio = time.perf_counter()
+    for proxy in [ProxyOriginal(ruta) for ruta in elegidas]:
+        proxy.mostrar()
+    duracion = time.perf_counter() - inicio
+    print(f"{'Sin caché':<24} {duracion * 1000:8.1f} ms, {ImagenSimulada.cargas:7,} cargas, "
+          f"{ImagenSimulada.cargas * tamano / 1e6:8.1f} MB retenidos")
+
+    for presupuesto in (archivos * tamano, archivos * tamano // 10):
+        ImagenSimulada.cargas = 0
+        cache = CacheImagenes(presupuesto, cargar=ImagenSimulada)
+        inicio = time.perf_counter()
+        for proxy in [ProxyImagen(ruta, cache) for ruta in elegidas]:
+            proxy.mostrar()
+        duracion = time.perf_counter() - inicio
+        print(f"Caché de {presupuesto / 1e6:6.1f} MB       {duracion * 1000:8.1f} ms, {ImagenSimulada.cargas:7,} cargas, "
+              f"{cache.bytes_usados / 1e6:8.1f} MB retenidos, aciertos {cache.tasa_aciertos:.1%}, "
+              f"{cache.expulsiones:,} expulsiones")
+
+
+if __name__ == "__main__":
+    demo()
+    benchmark_cache()